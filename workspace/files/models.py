@@ -9,6 +9,7 @@ from django.db.models.signals import pre_delete
 from django.dispatch import receiver
 from django.utils import timezone
 
+from workspace.common.cache import invalidate_tags
 from workspace.common.logging import scrub
 from workspace.common.uuids import uuid_v7_or_v4
 
@@ -209,10 +210,13 @@ class File(models.Model):
             raise ValueError("File and folder names must not contain '/'.")
 
         old_data = None
-        if self.pk:
+        # The UUID primary key is assigned on instantiation, so ``pk`` alone
+        # cannot tell a new row apart: without the ``adding`` check every
+        # INSERT would pay for a lookup of a row that cannot exist yet.
+        if self.pk and not self._state.adding:
             old_data = (
                 File.objects.filter(pk=self.pk)
-                .values("name", "parent_id", "path")
+                .values("name", "parent_id", "path", *self._CRUMB_FIELDS)
                 .first()
             )
 
@@ -223,17 +227,43 @@ class File(models.Model):
         if update_fields is not None:
             kwargs["update_fields"] = set(update_fields) | {"path"}
 
+        old_path = None
         if old_data:
             old_path = old_data.get("path")
             if not old_path:
                 old_path = self._build_path_for(old_data["name"], old_data["parent_id"])
-            if old_path and old_path != new_path:
-                with transaction.atomic():
-                    super().save(*args, **kwargs)
-                    self._update_descendant_paths(old_path, new_path)
-                return
+        if old_path and old_path != new_path:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                self._update_descendant_paths(old_path, new_path)
+        else:
+            super().save(*args, **kwargs)
+
+        # Evict only once the write is visible: a reader racing an earlier
+        # eviction would re-cache the pre-write rows under the new version.
+        if old_data and self._crumbs_changed(old_data, update_fields):
+            transaction.on_commit(self.invalidate_tree_cache)
+
+    # Folder columns rendered in breadcrumb trails.
+    _CRUMB_FIELDS = ("name", "icon", "color", "deleted_at")
+
+    def _crumbs_changed(self, old_data, update_fields):
+        if self.node_type != self.NodeType.FOLDER:
+            return False
+        fields = self._CRUMB_FIELDS
+        if update_fields is not None:
+            fields = [f for f in fields if f in update_fields]
+        return any(getattr(self, f) != old_data[f] for f in fields)
 
-        super().save(*args, **kwargs)
+    @property
+    def tree_cache_tag(self):
+        """Cache tag for data derived from the folder tree this node lives in."""
+        if self.group_id:
+            return f"files:tree:g:{self.group_id}"
+        return f"files:tree:u:{self.owner_id}"
+
+    def invalidate_tree_cache(self):
+        invalidate_tags(self.tree_cache_tag)
 
     @classmethod
     def _update_descendant_paths(cls, old_path, new_path):
@@ -304,10 +334,12 @@ class File(models.Model):
     def soft_delete(self, deleted_at=None):
         if deleted_at is None:
             deleted_at = timezone.now()
-        return File.objects.filter(
+        updated = File.objects.filter(
             self._descendant_filter(),
             deleted_at__isnull=True,
         ).update(deleted_at=deleted_at)
+        transaction.on_commit(self.invalidate_tree_cache)
+        return updated
 
     def _restore_parents(self):
         parent_id = self.parent_id
@@ -340,6 +372,7 @@ class File(models.Model):
                 self.save(update_fields=["deleted_at"])
                 updated = 1
         self._restore_parents()
+        transaction.on_commit(self.invalidate_tree_cache)
         return updated
 
     def delete(self, *args, **kwargs):
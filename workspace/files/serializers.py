@@ -27,6 +27,29 @@ def _require_annotation(obj, name):
         ) from exc
 
 
+# File columns FileSerializer reads. Read-only listings load just these via
+# ``.only()``; any other column touched while rendering costs a query per row.
+FILE_LIST_COLUMNS = (
+    "uuid",
+    "name",
+    "node_type",
+    "parent",
+    "content",
+    "size",
+    "mime_type",
+    "type",
+    "icon",
+    "color",
+    "owner",
+    "group",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+    "path",
+    "category",
+)
+
+
 class FileSerializer(serializers.ModelSerializer):
     is_folder = serializers.SerializerMethodField(
         help_text="True when node_type is 'folder'."
@@ -526,21 +526,57 @@ class FileService:
                 ).values_list("file_id", "permission")
             )
             for file_obj in share_candidates:
-                share = shares.get(file_obj.pk)
-                if share is None:
-                    permissions[file_obj.pk] = None
-                else:
-                    permissions[file_obj.pk] = (
-                        FilePermission.WRITE if share == "rw" else FilePermission.VIEW
-                    )
+                permissions[file_obj.pk] = FileService._share_permission(
+                    shares.get(file_obj.pk)
+                )
 
         return permissions
 
+    @staticmethod
+    def _share_permission(share):
+        """Map a ``FileShare.permission`` value (or None) to a level."""
+        if share is None:
+            return None
+        return FilePermission.WRITE if share == "rw" else FilePermission.VIEW
+
     @staticmethod
     def get_permission(user, file_obj):
         """Return the access permission level for *user* on *file_obj*."""
         return FileService.get_permissions_bulk(user, [file_obj])[file_obj.pk]
 
+    @staticmethod
+    def get_live_file_with_permission(user, uuid):
+        """Return ``(file, permission)`` for the live file *uuid*.
+
+        Same semantics as :meth:`get_permission`, but the group membership
+        and share lookups ride along as subqueries of the fetch, so it is
+        one query instead of up to three. Returns ``(None, None)`` when no
+        live file matches.
+        """
+        from django.db.models import Exists, OuterRef, Subquery
+
+        from workspace.files.models import FileShare
+
+        file_obj = (
+            File.objects.filter(uuid=uuid, deleted_at__isnull=True)
+            .annotate(
+                _user_in_group=Exists(user.groups.filter(pk=OuterRef("group_id"))),
+                _user_share=Subquery(
+                    FileShare.objects.filter(
+                        file_id=OuterRef("pk"), shared_with=user
+                    ).values("permission")[:1]
+                ),
+            )
+            .first()
+        )
+        if file_obj is None:
+            return None, None
+        if file_obj.owner_id == user.id:
+            return file_obj, FilePermission.MANAGE
+        if file_obj.group_id and file_obj._user_in_group:
+            return file_obj, FilePermission.EDIT
+        return file_obj, FileService._share_permission(file_obj._user_share)
+
     @staticmethod
     def can_access(user, file_obj):
         """Check whether *user* can access *file_obj*."""
@@ -1,6 +1,7 @@
 """File type registry - maps content labels to display properties and viewers."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from workspace.files.services.detection import (
     get_all_labels,
@@ -71,13 +72,14 @@ def _normalize_group(label: str) -> str:
     return "unknown"
 
 
+@lru_cache(maxsize=512)
 def _resolve_viewers(
     label: str,
     group: str,
     ext_label: str = "",
     ext_group: str = "",
     file_has_extension: bool = True,
-):
+) -> tuple:
     """Rank every viewer that can handle the content type and extension hint.
 
     Content detection stays primary; the extension only acts as a tiebreaker
@@ -94,6 +96,9 @@ def _resolve_viewers(
 
     Viewers declaring ``requires_extension`` are skipped entirely when the file
     has no extension, so content-only detection never routes to them.
+
+    Memoized: the inputs come from a small, fixed set of labels and groups,
+    and the viewer classes are all defined when ``viewers`` is imported.
     """
     from workspace.files.ui.viewers import BaseViewer
 
@@ -117,7 +122,7 @@ def _resolve_viewers(
         # Sort on the weight alone: a plain sorted() over the (weight, cls)
         # tuples would compare classes on a tie and raise TypeError.
         ordered.extend(cls for _, cls in sorted(candidates, key=lambda x: x[0]))
-    return ordered
+    return tuple(ordered)
 
 
 def _resolve_label(label_or_mime: str) -> str:
@@ -201,7 +206,9 @@ def get_viewers(label: str, name: str = "") -> list:
     label = _resolve_label(label)
     group = _normalize_group(label)
     ext_label, ext_group, file_has_extension = _extension_hints(label, name)
-    return _resolve_viewers(label, group, ext_label, ext_group, file_has_extension)
+    return list(
+        _resolve_viewers(label, group, ext_label, ext_group, file_has_extension)
+    )
 
 
 def get_viewer_slug(label: str, name: str = "") -> str:
@@ -219,12 +226,18 @@ def get_viewer_by_slug(slug: str):
     """
     if not slug:
         return None
+    return _viewers_by_slug().get(slug)
+
+
+@lru_cache(maxsize=1)
+def _viewers_by_slug() -> dict:
+    """Slug -> viewer class map, built once behind the deferred UI import."""
     from workspace.files.ui.viewers import BaseViewer
 
+    viewers = {}
     for viewer_cls in BaseViewer.__subclasses__():
-        if viewer_cls.slug == slug:
-            return viewer_cls
-    return None
+        viewers.setdefault(viewer_cls.slug, viewer_cls)
+    return viewers
 
 
 # Containers whose byte-level label cannot distinguish an audio-only payload
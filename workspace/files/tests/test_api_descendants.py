@@ -98,6 +98,18 @@ class DescendantsAPITests(APITestCase):
             },
         )
 
+    def test_descendants_flag_parsed_like_other_boolean_params(self):
+        for value, expected in (("YES", 3), ("on", 3), ("false", 1), ("", 1)):
+            resp = self.client.get(
+                "/api/v1/files",
+                {
+                    "parent": str(self.root.uuid),
+                    "type": "markdown",
+                    "descendants": value,
+                },
+            )
+            self.assertEqual(len(resp.data), expected, value)
+
     def test_descendants_excludes_files_outside_tree(self):
         resp = self.client.get(
             "/api/v1/files",
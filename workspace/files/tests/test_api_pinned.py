@@ -2,6 +2,8 @@ import uuid as uuid_module
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -151,6 +153,40 @@ class PinnedFolderAPITests(APITestCase):
         uuids = [item["uuid"] for item in response.data]
         self.assertIn(str(group_sub.uuid), uuids)
 
+    def test_list_pinned_follows_pin_position(self):
+        late = self._make_pin("Alpha", 2)
+        early = self._make_pin("Zulu", 0)
+        middle = self._make_pin("Mike", 1)
+
+        response = self.client.get("/api/v1/files/pinned")
+        self.assertEqual(
+            [item["uuid"] for item in response.data],
+            [str(early.uuid), str(middle.uuid), str(late.uuid)],
+        )
+
+    def test_list_pinned_joins_pins_once(self):
+        self._make_pin("A", 0)
+        self._make_pin("B", 1)
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="pw"
+        )
+        shared_pin = self._make_pin("C", 2)
+        PinnedFolder.objects.create(owner=other, folder=shared_pin, position=0)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/v1/files/pinned")
+        self.assertEqual(len(response.data), 3)
+        pin_queries = [
+            q["sql"] for q in ctx.captured_queries if "files_pinnedfolder" in q["sql"]
+        ]
+        self.assertEqual(len(pin_queries), 1)
+        self.assertEqual(pin_queries[0].count('JOIN "files_pinnedfolder"'), 1)
+
+    def test_list_pinned_empty(self):
+        response = self.client.get("/api/v1/files/pinned")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
     def test_reorder_pinned_folders(self):
         """Test reordering pinned folders."""
         folder1 = File.objects.create(
@@ -99,8 +99,26 @@ class ContentRangeTests(APITestCase):
         self.assertEqual(resp.status_code, status.HTTP_206_PARTIAL_CONTENT)
         self.assertEqual(_body(resp), self.payload[:10])
 
+    def test_text_content_streamed_byte_for_byte(self):
+        payload = "caf\u00e9\n".encode("latin-1")
+        text_file = File(
+            owner=self.user,
+            name="legacy.txt",
+            node_type=File.NodeType.FILE,
+            mime_type="text/plain",
+        )
+        text_file.content = ContentFile(payload, name="legacy.txt")
+        text_file.size = len(payload)
+        text_file.save()
+
+        resp = self.client.get(f"/api/v1/files/{text_file.uuid}/content")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertTrue(resp.streaming)
+        self.assertEqual(resp["Content-Type"], "text/plain")
+        self.assertEqual(_body(resp), payload)
+
     def test_text_response_advertises_accept_ranges(self):
-        """Even on the text fast path, clients must learn Range is supported."""
+        """Text files stream like any other file and still advertise Range support."""
         text_file = File(
             owner=self.user,
             name="note.txt",
@@ -1,8 +1,19 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from workspace.files.models import File
+from workspace.files.models import (
+    File,
+    FileFavorite,
+    FileShare,
+    FileTag,
+    PinnedFolder,
+    Tag,
+)
 
 User = get_user_model()
 
@@ -28,6 +39,67 @@ class TrashAPITests(APITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["uuid"], str(file.uuid))
 
+    def test_trash_listing_streams_in_chunks_with_tags(self):
+        tag = Tag.objects.create(owner=self.user, name="archive")
+        for i in range(5):
+            trashed = File.objects.create(
+                owner=self.user, name=f"t{i}.txt", node_type=File.NodeType.FILE
+            )
+            FileTag.objects.create(file=trashed, tag=tag)
+            trashed.delete()
+
+        with mock.patch("workspace.files.viewsets.trash.TRASH_LIST_CHUNK_SIZE", 2):
+            response = self.client.get("/api/v1/files/trash?ordering=name")
+
+        self.assertEqual(
+            [item["name"] for item in response.data],
+            [f"t{i}.txt" for i in range(5)],
+        )
+        for item in response.data:
+            self.assertEqual([t["name"] for t in item["tags"]], ["archive"])
+
+    def test_listings_skip_unserialized_share_permission(self):
+        File.objects.create(
+            owner=self.user, name="trashed.txt", node_type=File.NodeType.FILE
+        ).delete()
+        with CaptureQueriesContext(connection) as ctx:
+            for url in (
+                "/api/v1/files",
+                "/api/v1/files/trash",
+                "/api/v1/files/shared-with-me",
+                "/api/v1/files?favorites=1",
+            ):
+                self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            any("user_share_permission" in q["sql"] for q in ctx.captured_queries)
+        )
+
+    def test_listings_load_only_serialized_columns(self):
+        folder = File.objects.create(
+            owner=self.user, name="Pinned", node_type=File.NodeType.FOLDER
+        )
+        PinnedFolder.objects.create(owner=self.user, folder=folder, position=0)
+        File.objects.create(
+            owner=self.user, name="trashed.txt", node_type=File.NodeType.FILE
+        ).delete()
+        with CaptureQueriesContext(connection) as ctx:
+            for url in (
+                "/api/v1/files",
+                "/api/v1/files/trash",
+                "/api/v1/files/pinned",
+            ):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.data), 1)
+        listing_sql = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith('SELECT "files_file"."uuid"')
+        ]
+        self.assertEqual(len(listing_sql), 3)
+        for sql in listing_sql:
+            self.assertNotIn('"files_file"."lock_expires_at"', sql)
+
     def test_trash_does_not_show_active_files(self):
         """Test that trash only shows deleted items."""
         File.objects.create(
@@ -43,6 +115,24 @@ class TrashAPITests(APITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["uuid"], str(trashed_file.uuid))
 
+    def test_status_only_actions_skip_serializer_annotations(self):
+        """destroy/restore/purge never render the file, so its lookup
+        carries none of FileSerializer's per-row subqueries."""
+        file = File.objects.create(
+            owner=self.user, name="cycle.txt", node_type=File.NodeType.FILE
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            deleted = self.client.delete(f"/api/v1/files/{file.uuid}")
+            restored = self.client.post(f"/api/v1/files/{file.uuid}/restore")
+            self.client.delete(f"/api/v1/files/{file.uuid}")
+            purged = self.client.delete(f"/api/v1/files/{file.uuid}/purge")
+
+        self.assertEqual(deleted.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(restored.status_code, status.HTTP_200_OK)
+        self.assertEqual(purged.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(File.objects.filter(pk=file.pk).exists())
+        self.assertFalse(any('"is_favorite"' in q["sql"] for q in ctx.captured_queries))
+
     def test_restore_from_trash(self):
         """Test restoring an item from trash."""
         file = File.objects.create(
@@ -92,3 +182,66 @@ class TrashAPITests(APITestCase):
         self.assertEqual(response.data["deleted"], 1)
 
         self.assertFalse(File.objects.filter(uuid=file.uuid).exists())
+
+    def test_clean_trash_counts_files_not_cascaded_rows(self):
+        other = User.objects.create_user(username="other", password="x")
+        folder = File.objects.create(
+            owner=self.user, name="old", node_type=File.NodeType.FOLDER
+        )
+        inner = File.objects.create(
+            owner=self.user,
+            name="inner.txt",
+            node_type=File.NodeType.FILE,
+            parent=folder,
+        )
+        FileShare.objects.create(file=inner, shared_by=self.user, shared_with=other)
+        FileFavorite.objects.create(owner=self.user, file=inner)
+        folder.delete()
+
+        response = self.client.delete("/api/v1/files/trash/clean?force=1")
+
+        self.assertEqual(response.data["deleted"], 2)
+        self.assertFalse(FileShare.objects.filter(file_id=inner.pk).exists())
+
+    def test_clean_trash_force_flag_spellings(self):
+        for value, forced in (("TRUE", True), ("on", True), ("0", False)):
+            File.objects.create(
+                owner=self.user, name=f"{value}.txt", node_type=File.NodeType.FILE
+            ).delete()
+            response = self.client.delete(f"/api/v1/files/trash/clean?force={value}")
+            self.assertIs(response.data["force"], forced, value)
+            self.assertEqual(response.data["deleted"], int(forced), value)
+
+    def test_clean_trash_deletes_in_batches(self):
+        folder = File.objects.create(
+            owner=self.user, name="old", node_type=File.NodeType.FOLDER
+        )
+        for i in range(3):
+            File.objects.create(
+                owner=self.user,
+                name=f"inner{i}.txt",
+                node_type=File.NodeType.FILE,
+                parent=folder,
+            )
+        for i in range(2):
+            File.objects.create(
+                owner=self.user, name=f"loose{i}.txt", node_type=File.NodeType.FILE
+            )
+        for node in File.objects.filter(owner=self.user, parent__isnull=True):
+            node.delete()
+
+        with mock.patch("workspace.files.viewsets.trash.CLEAN_TRASH_BATCH_SIZE", 2):
+            response = self.client.delete("/api/v1/files/trash/clean?force=1")
+
+        self.assertEqual(response.data["deleted"], 6)
+        self.assertFalse(File.objects.filter(owner=self.user).exists())
+
+    def test_clean_trash_without_matches_reports_zero(self):
+        File.objects.create(
+            owner=self.user, name="recent.txt", node_type=File.NodeType.FILE
+        ).delete()
+
+        response = self.client.delete("/api/v1/files/trash/clean")
+
+        self.assertEqual(response.data["deleted"], 0)
+        self.assertEqual(File.objects.filter(owner=self.user).count(), 1)
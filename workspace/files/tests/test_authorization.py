@@ -1,3 +1,5 @@
+import uuid as uuid_module
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.test import TestCase
@@ -327,6 +329,46 @@ class GetPermissionTests(FileAuthzMixin, TestCase):
         self.assertGreater(FilePermission.WRITE, FilePermission.VIEW)
 
 
+class GetLiveFileWithPermissionTests(FileAuthzMixin, TestCase):
+    def _share(self, f, permission):
+        FileShare.objects.create(
+            file=f, shared_by=f.owner, shared_with=self.alice, permission=permission
+        )
+        return f
+
+    def test_matches_get_permission_in_one_query(self):
+        sales = Group.objects.create(name="Sales")
+        sales_root = self._make_folder(self.bob, name="Sales", group=sales)
+        files = [
+            self._make_file(self.alice),
+            self._make_file(self.bob, group=self.group),
+            self._share(self._make_file(self.bob), "rw"),
+            self._share(self._make_file(self.bob), "ro"),
+            self._share(
+                self._make_file(self.bob, parent=sales_root, group=sales), "ro"
+            ),
+            sales_root,
+            self._make_file(self.bob),
+        ]
+        for f in files:
+            with self.subTest(file=f.name), self.assertNumQueries(1):
+                file_obj, perm = FileService.get_live_file_with_permission(
+                    self.alice, f.uuid
+                )
+            self.assertEqual(file_obj, f)
+            self.assertEqual(perm, FileService.get_permission(self.alice, f))
+
+    def test_deleted_or_missing_file_returns_nothing(self):
+        f = self._make_file(self.alice)
+        f.deleted_at = timezone.now()
+        f.save()
+        for uuid in (f.uuid, uuid_module.uuid4()):
+            self.assertEqual(
+                FileService.get_live_file_with_permission(self.alice, uuid),
+                (None, None),
+            )
+
+
 # ── can_access ──────────────────────────────────────────────────
 
 
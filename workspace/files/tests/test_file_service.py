@@ -80,6 +80,20 @@ class TestCreateFolder(TestCase):
         self.assertEqual(child.parent, parent)
         self.assertEqual(child.path, "Root/Sub")
 
+    def test_new_row_skips_previous_state_lookup(self):
+        """Inserting a node costs the parent path lookup and the INSERT,
+        never a lookup of a "previous" row that cannot exist yet."""
+        parent = FileService.create_folder(self.user, "Root")
+        node = File(
+            owner=self.user,
+            name="Sub",
+            node_type=File.NodeType.FOLDER,
+            parent=parent,
+        )
+        with self.assertNumQueries(2):
+            node.save()
+        self.assertEqual(node.path, "Root/Sub")
+
     def test_with_icon_and_color(self):
         folder = FileService.create_folder(
             self.user, "Work", icon="briefcase", color="#ff0000"
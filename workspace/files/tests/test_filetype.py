@@ -2,12 +2,14 @@ from django.test import TestCase
 
 from workspace.files.services.filetype import (
     FileTypeInfo,
+    _resolve_viewers,
     get_color,
     get_group,
     get_icon,
     get_info,
     get_mime_type,
     get_viewer,
+    get_viewer_by_slug,
     get_viewer_slug,
     get_viewers,
     is_viewable,
@@ -389,6 +391,24 @@ class ViewerSlugAndPinningTest(TestCase):
     def test_get_viewers_is_empty_when_nothing_handles_the_label(self):
         self.assertEqual(get_viewers("unknown"), [])
 
+    def test_get_viewer_by_slug_maps_every_viewer(self):
+        from workspace.files.ui.viewers import BaseViewer
+
+        for viewer_cls in BaseViewer.__subclasses__():
+            self.assertIs(get_viewer_by_slug(viewer_cls.slug), viewer_cls)
+        self.assertIsNone(get_viewer_by_slug("no-such-viewer"))
+        self.assertIsNone(get_viewer_by_slug(""))
+
+    def test_repeat_resolution_is_memoized(self):
+        get_viewer("python", "main.py")
+        hits = _resolve_viewers.cache_info().hits
+        self.assertIs(get_viewer("python", "other.py"), TextViewer)
+        self.assertEqual(_resolve_viewers.cache_info().hits, hits + 1)
+
+    def test_get_viewers_result_does_not_alias_the_cache(self):
+        get_viewers("mp3").clear()
+        self.assertEqual(get_viewers("mp3")[0], AudioViewer)
+
     def test_pin_audio_only_webm(self):
         """MediaRecorder emits audio/webm; Magika sees only the container."""
         self.assertEqual(
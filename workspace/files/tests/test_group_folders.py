@@ -758,6 +758,19 @@ class BreadcrumbTests(TestCase):
         self.assertEqual(crumbs[1]["icon"], "briefcase")
         self.assertEqual(crumbs[1]["icon_color"], "text-error")
 
+    def test_deep_folder_ancestors_fetched_in_one_query(self):
+        folder = None
+        for name in ("A", "B", "C", "D", "E"):
+            folder = File.objects.create(
+                owner=self.alice,
+                name=name,
+                node_type=File.NodeType.FOLDER,
+                parent=folder,
+            )
+        with self.assertNumQueries(1):
+            crumbs = build_breadcrumbs(folder, user=self.alice)
+        self.assertEqual([c["label"] for c in crumbs[1:]], ["A", "B", "C", "D", "E"])
+
     def test_breadcrumbs_include_uuid(self):
         """Breadcrumb dicts for folders must include a 'uuid' key."""
         parent = File.objects.create(
@@ -864,6 +877,101 @@ class BreadcrumbQueryCountTests(TestCase):
         self.assertEqual(crumbs[0]["label"], "Groups")
 
 
+class BreadcrumbCacheTests(TestCase):
+    """Breadcrumb trails are cached per folder and evicted by tree edits."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="alice", password="pass")
+        self.top = File.objects.create(
+            owner=self.user, name="Top", node_type=File.NodeType.FOLDER
+        )
+        self.mid = File.objects.create(
+            owner=self.user,
+            name="Mid",
+            node_type=File.NodeType.FOLDER,
+            parent=self.top,
+        )
+        self.leaf = File.objects.create(
+            owner=self.user,
+            name="Leaf",
+            node_type=File.NodeType.FOLDER,
+            parent=self.mid,
+        )
+
+    def _labels(self):
+        leaf = File.objects.get(pk=self.leaf.pk)
+        return [c["label"] for c in build_breadcrumbs(leaf, user=self.user)[1:]]
+
+    def _cached_labels(self):
+        return [c["label"] for c in build_breadcrumbs(self.leaf, user=self.user)]
+
+    def test_repeat_lookup_skips_database(self):
+        build_breadcrumbs(self.leaf, user=self.user)
+        with self.assertNumQueries(0):
+            crumbs = build_breadcrumbs(self.leaf, user=self.user)
+        self.assertEqual([c["label"] for c in crumbs[1:]], ["Top", "Mid", "Leaf"])
+
+    def test_cached_trail_not_mutated_by_root_entry(self):
+        build_breadcrumbs(self.leaf, user=self.user)
+        self.assertEqual(len(build_breadcrumbs(self.leaf, user=self.user)), 4)
+
+    def test_ancestor_rename_refreshes_trail(self):
+        self._labels()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.top.name = "Renamed"
+            self.top.save()
+        self.assertEqual(self._labels(), ["Renamed", "Mid", "Leaf"])
+
+    def test_ancestor_icon_change_refreshes_trail(self):
+        self._labels()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.mid.icon = "star"
+            self.mid.save()
+        leaf = File.objects.get(pk=self.leaf.pk)
+        self.assertEqual(build_breadcrumbs(leaf, user=self.user)[2]["icon"], "star")
+
+    def test_ancestor_trash_and_restore_refreshes_trail(self):
+        self._labels()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.mid.soft_delete()
+        self.assertEqual(self._labels(), ["Top", "Leaf"])
+        with self.captureOnCommitCallbacks(execute=True):
+            File.objects.get(pk=self.mid.pk).restore()
+        self.assertEqual(self._labels(), ["Top", "Mid", "Leaf"])
+
+    def test_trail_cached_before_commit_is_not_kept(self):
+        stale_leaf = File.objects.get(pk=self.leaf.pk)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.leaf.color = "text-danger"
+            self.leaf.save()
+            # A concurrent request that read the row before the write lands
+            # caches its trail while the transaction is still open.
+            build_breadcrumbs(stale_leaf, user=self.user)
+        self.assertEqual(len(callbacks), 1)
+        leaf = File.objects.get(pk=self.leaf.pk)
+        crumbs = build_breadcrumbs(leaf, user=self.user)
+        self.assertEqual(crumbs[-1]["icon_color"], "text-danger")
+
+    def test_trashing_waits_for_commit(self):
+        self._labels()
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.mid.soft_delete()
+            with self.assertNumQueries(0):
+                self._cached_labels()
+        self.assertEqual(len(callbacks), 1)
+
+    def test_saves_without_crumb_changes_keep_trail(self):
+        self._labels()
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.mid.size = 42
+            self.mid.save(update_fields=["size"])
+            self.mid.name = "Mid"
+            self.mid.save()
+        self.assertEqual(callbacks, [])
+        with self.assertNumQueries(0):
+            self._cached_labels()
+
+
 class BreadcrumbSpecialCharTests(TestCase):
     """Breadcrumbs must handle folder names with spaces, unicode, and symbols."""
 
@@ -478,6 +478,31 @@ class ShareAPITests(APITestCase):
         uuids = [f["uuid"] for f in resp.data]
         self.assertIn(str(self.file.uuid), uuids)
 
+    def test_favorites_list_once_per_file_without_distinct(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from workspace.files.models import FileFavorite
+
+        third = User.objects.create_user(username="third_fav", password="x")
+        for recipient in (self.other_user, third):
+            FileShare.objects.create(
+                file=self.file, shared_by=self.user, shared_with=recipient
+            )
+        FileFavorite.objects.create(owner=self.user, file=self.file)
+        trashed = File.objects.create(
+            owner=self.user, name="gone.txt", node_type=File.NodeType.FILE
+        )
+        FileFavorite.objects.create(owner=self.user, file=trashed)
+        trashed.delete()
+
+        self.client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get("/api/v1/files?favorites=1")
+
+        self.assertEqual([f["uuid"] for f in resp.data], [str(self.file.uuid)])
+        self.assertFalse(any("DISTINCT" in q["sql"] for q in ctx.captured_queries))
+
 
 class UserSearchAPITests(APITestCase):
     """Tests for the user search endpoint."""
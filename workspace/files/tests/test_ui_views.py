@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.db import connection
@@ -5,6 +7,8 @@ from django.test import TestCase
 from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from workspace.files.models import File, FileFavorite, FileShare, PinnedFolder
+from workspace.files.services import FileService
 from workspace.users.services.settings import set_setting
 
 User = get_user_model()
@@ -74,3 +78,230 @@ class FilesIndexSettingsTests(TestCase):
             f"expected a single files users_usersetting query, got "
             f"{len(setting_queries)}:\n" + "\n".join(setting_queries),
         )
+
+
+class FilesIndexListingTests(TestCase):
+    """Per-row values the listing template reads more than once are resolved
+    a single time while building the context."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="listing_user",
+            email="listing@test.com",
+            password="x",
+        )
+        self.client.force_login(self.user)
+
+    def test_is_viewable_resolved_once_per_node(self):
+        FileService.create_folder(self.user, "Docs")
+        FileService.create_file(self.user, "a.txt", mime_type="text/plain")
+        FileService.create_file(self.user, "b.txt", mime_type="text/plain")
+
+        with mock.patch.object(
+            File, "is_viewable", autospec=True, side_effect=File.is_viewable
+        ) as is_viewable:
+            response = self.client.get(reverse("files_ui:index"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(is_viewable.call_count, 3)
+        self.assertContains(response, 'data-viewable="1"')
+
+    def test_folder_stats_counted_from_listed_rows(self):
+        FileService.create_folder(self.user, "Docs")
+        for name, size in (("a.txt", 5), ("b.txt", 3)):
+            file_obj = FileService.create_file(self.user, name, mime_type="text/plain")
+            File.objects.filter(pk=file_obj.pk).update(size=size)
+
+        response = self.client.get(reverse("files_ui:index"))
+
+        self.assertEqual(
+            response.context["folder_stats"],
+            {"file_count": 2, "folder_count": 1, "total_size": 8},
+        )
+        # The stats pass materializes the listing; the template reuses it.
+        self.assertIsNotNone(response.context["nodes"]._result_cache)
+
+    def test_listing_loads_only_rendered_columns(self):
+        FileService.create_folder(self.user, "Docs")
+        FileService.create_file(self.user, "a.txt", mime_type="text/plain")
+        url = reverse("files_ui:index")
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as two_rows:
+            response = self.client.get(url)
+
+        for node in response.context["nodes"]:
+            self.assertTrue({"path", "content"} <= node.get_deferred_fields())
+
+        FileService.create_file(self.user, "b.txt", mime_type="text/plain")
+        FileService.create_folder(self.user, "More")
+        with CaptureQueriesContext(connection) as four_rows:
+            self.client.get(url)
+        # No deferred column is lazily loaded back per row while rendering.
+        self.assertEqual(len(four_rows), len(two_rows))
+
+    def test_view_flags_accept_truthy_values_case_insensitively(self):
+        for value in ("1", "true", "YES", "on", "t", "y"):
+            response = self.client.get(reverse("files_ui:index"), {"recent": value})
+            self.assertTrue(response.context["is_recent_view"], value)
+        for value in ("0", "false", "off"):
+            response = self.client.get(reverse("files_ui:index"), {"recent": value})
+            self.assertFalse(response.context["is_recent_view"], value)
+
+    def test_favorites_listed_once_and_only_while_accessible(self):
+        other = User.objects.create_user(username="other", password="x")
+        third = User.objects.create_user(username="third", password="x")
+        kept = FileService.create_file(self.user, "kept.txt", mime_type="text/plain")
+        for recipient in (other, third):
+            FileShare.objects.create(
+                file=kept, shared_by=self.user, shared_with=recipient
+            )
+        trashed = FileService.create_file(self.user, "gone.txt", mime_type="text/plain")
+        foreign = FileService.create_file(other, "theirs.txt", mime_type="text/plain")
+        for file_obj in (kept, trashed, foreign):
+            FileFavorite.objects.create(owner=self.user, file=file_obj)
+        FileService.soft_delete(trashed)
+
+        response = self.client.get(reverse("files_ui:index"), {"favorites": "1"})
+
+        self.assertEqual(
+            [node.name for node in response.context["nodes"]], ["kept.txt"]
+        )
+
+    def test_favorites_listing_marks_rows_favorite(self):
+        file_obj = FileService.create_file(
+            self.user, "star.txt", mime_type="text/plain"
+        )
+        FileFavorite.objects.create(owner=self.user, file=file_obj)
+
+        response = self.client.get(reverse("files_ui:index"), {"favorites": "1"})
+
+        (node,) = response.context["nodes"]
+        self.assertIs(node.is_favorite, True)
+        self.assertContains(response, 'data-favorite="1"')
+
+    def _pinned_subfolder(self):
+        pinned = FileService.create_folder(self.user, "Pinned")
+        PinnedFolder.objects.create(owner=self.user, folder=pinned)
+        child = FileService.create_folder(self.user, "Child", parent=pinned)
+        return pinned, child
+
+    def test_trash_lists_only_trashed_roots(self):
+        live = FileService.create_folder(self.user, "Live")
+        loose = FileService.create_file(
+            self.user, "loose.txt", parent=live, mime_type="text/plain"
+        )
+        gone = FileService.create_folder(self.user, "Gone")
+        FileService.create_file(
+            self.user, "inner.txt", parent=gone, mime_type="text/plain"
+        )
+        top = FileService.create_file(self.user, "top.txt", mime_type="text/plain")
+        for node in (loose, gone, top):
+            FileService.soft_delete(node)
+
+        response = self.client.get(reverse("files_ui:trash"))
+
+        self.assertEqual(
+            {node.name for node in response.context["nodes"]},
+            {"loose.txt", "Gone", "top.txt"},
+        )
+
+    def test_partial_navigation_skips_sidebar_data(self):
+        pinned, child = self._pinned_subfolder()
+
+        response = self.client.get(
+            reverse("files_ui:folder", kwargs={"folder": child.uuid}),
+            headers={"X-Alpine-Request": "true"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.context["pinned_folders"])
+        self.assertIsNone(response.context["group_folders"])
+        self.assertEqual(response.context["sidebar_active"], f"pinned:{pinned.uuid}")
+
+    def test_full_page_keeps_sidebar_data(self):
+        pinned, child = self._pinned_subfolder()
+
+        response = self.client.get(
+            reverse("files_ui:folder", kwargs={"folder": child.uuid})
+        )
+
+        self.assertEqual(
+            [pin.folder_id for pin in response.context["pinned_folders"]],
+            [pinned.uuid],
+        )
+        self.assertEqual(response.context["sidebar_active"], f"pinned:{pinned.uuid}")
+
+    def test_pinned_partial_matches_sidebar_pins(self):
+        favorite, _child = self._pinned_subfolder()
+        FileFavorite.objects.create(owner=self.user, file=favorite)
+        plain = FileService.create_folder(self.user, "Plain")
+        PinnedFolder.objects.create(owner=self.user, folder=plain, position=1)
+        trashed = FileService.create_folder(self.user, "Trashed")
+        PinnedFolder.objects.create(owner=self.user, folder=trashed, position=2)
+        FileService.soft_delete(trashed)
+
+        page = self.client.get(reverse("files_ui:index"))
+        with self.assertNumQueries(3):  # session, user, pins
+            partial = self.client.get(reverse("files_ui:pinned_folders"))
+
+        for response in (page, partial):
+            self.assertEqual(
+                [
+                    (pin.folder_id, pin.folder.is_favorite)
+                    for pin in response.context["pinned_folders"]
+                ],
+                [(favorite.uuid, True), (plain.uuid, False)],
+            )
+
+    def test_listing_skips_share_lookups_it_does_not_render(self):
+        FileService.create_file(self.user, "a.txt", mime_type="text/plain")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("files_ui:index"))
+
+        listing_sql = [
+            q["sql"] for q in ctx.captured_queries if "is_pinned" in q["sql"]
+        ]
+        self.assertEqual(len(listing_sql), 1)
+        self.assertNotIn(FileShare._meta.db_table, listing_sql[0])
+        self.assertEqual([n.name for n in response.context["nodes"]], ["a.txt"])
+
+
+class FilesPropertiesTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="props_user", password="x")
+        self.client.force_login(self.user)
+
+    def _get(self, node):
+        return self.client.get(
+            reverse("files_ui:properties", kwargs={"uuid": node.uuid})
+        )
+
+    def test_favorite_and_pinned_flags_come_from_the_file_fetch(self):
+        folder = FileService.create_folder(self.user, "Docs")
+        FileFavorite.objects.create(owner=self.user, file=folder)
+        PinnedFolder.objects.create(owner=self.user, folder=folder)
+        plain = FileService.create_file(self.user, "a.txt", mime_type="text/plain")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._get(folder)
+        self.assertTrue(response.context["is_favorite"])
+        self.assertTrue(response.context["is_pinned"])
+        favorite_table = FileFavorite._meta.db_table
+        self.assertEqual(
+            sum(favorite_table in q["sql"] for q in ctx.captured_queries), 1
+        )
+
+        response = self._get(plain)
+        self.assertFalse(response.context["is_favorite"])
+        self.assertFalse(response.context["is_pinned"])
+
+    def test_other_users_favorites_do_not_leak(self):
+        other = User.objects.create_user(username="props_other", password="x")
+        folder = FileService.create_folder(self.user, "Docs")
+        FileFavorite.objects.create(owner=other, file=folder)
+        PinnedFolder.objects.create(owner=other, folder=folder)
+
+        response = self._get(folder)
+
+        self.assertFalse(response.context["is_favorite"])
+        self.assertFalse(response.context["is_pinned"])
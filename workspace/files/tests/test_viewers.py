@@ -0,0 +1,99 @@
+"""Tests for the server-side file viewers."""
+
+import io
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models.fields.files import FieldFile
+from django.test import RequestFactory, TestCase, override_settings
+
+from workspace.files.services import FileService
+from workspace.files.ui.viewers import (
+    MAX_INLINE_TEXT_BYTES,
+    MarkdownViewer,
+    TextViewer,
+)
+
+User = get_user_model()
+
+
+class TextContentTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.user = User.objects.create_user(
+            username="viewer", email="viewer@test.com", password="pw"
+        )
+        self.request = RequestFactory().get("/")
+        self.request.user = self.user
+
+    def _file(self, name, data, content_type="text/plain"):
+        return FileService.create_file(
+            owner=self.user,
+            name=name,
+            content=SimpleUploadedFile(name, data, content_type=content_type),
+            acting_user=self.user,
+        )
+
+    def test_text_viewer_renders_decoded_content(self):
+        viewer = TextViewer(self._file("notes.txt", b"hello viewer"))
+        self.assertIn("hello viewer", viewer.render(self.request))
+
+    def test_markdown_viewer_renders_decoded_content(self):
+        viewer = MarkdownViewer(self._file("readme.md", b"# Title\n"))
+        self.assertIn("# Title", viewer.render(self.request))
+
+    def test_content_opened_once_per_viewer(self):
+        viewer = TextViewer(self._file("notes.txt", b"hello viewer"))
+        with mock.patch.object(
+            FieldFile, "open", autospec=True, side_effect=FieldFile.open
+        ) as field_open:
+            viewer.render(self.request)
+            viewer.render(self.request)
+        self.assertEqual(field_open.call_count, 1)
+        self.assertTrue(viewer.file.content.closed)
+
+    def test_undecodable_content_falls_back_to_empty(self):
+        viewer = TextViewer(self._file("blob.txt", b"\xff\xfe\xfa"))
+        self.assertEqual(viewer._text_content, "")
+
+    def test_large_text_deferred_to_content_endpoint(self):
+        file_obj = self._file("big.log", b"line\n")
+        file_obj.size = MAX_INLINE_TEXT_BYTES + 1
+        for viewer_cls in (TextViewer, MarkdownViewer):
+            viewer = viewer_cls(file_obj)
+            with mock.patch.object(FieldFile, "open") as field_open:
+                html = viewer.render(self.request)
+            field_open.assert_not_called()
+            self.assertIn("originalContent: ''", html)
+            self.assertIn("contentUrl: '/api/v1/files/", html)
+
+    def test_small_text_inlined_without_fetch(self):
+        viewer = TextViewer(self._file("notes.txt", b"hello viewer"))
+        self.assertIn("contentUrl: null", viewer.render(self.request))
+
+    def test_stale_size_never_reads_past_inline_limit(self):
+        file_obj = self._file("grown.txt", b"x" * (MAX_INLINE_TEXT_BYTES + 10))
+        file_obj.size = 0
+        viewer = TextViewer(file_obj)
+        self.assertIn("contentUrl: '/api/v1/files/", viewer.render(self.request))
+        self.assertIsNone(viewer._text_content)
+
+    def test_read_sized_from_recorded_size(self):
+        viewer = TextViewer(self._file("notes.txt", b"hello viewer"))
+        handle = mock.MagicMock(wraps=io.BytesIO(b"hello viewer"))
+        with mock.patch.object(FieldFile, "open") as field_open:
+            field_open.return_value.__enter__.return_value = handle
+            self.assertEqual(viewer._text_content, "hello viewer")
+        self.assertEqual(handle.read.call_args_list, [mock.call(13)])
+
+    def test_content_grown_past_recorded_size_read_in_full(self):
+        file_obj = self._file("grown.txt", b"hello viewer")
+        file_obj.size = 2
+        self.assertEqual(TextViewer(file_obj)._text_content, "hello viewer")
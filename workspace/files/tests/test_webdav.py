@@ -1,16 +1,22 @@
 """Tests for the WebDAV integration (domain controller, provider, resources)."""
 
 import base64
+import functools
 import io
 import os
+from collections import ChainMap
+from datetime import timedelta
+from types import MappingProxyType
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.core.files.base import ContentFile
 from django.test import TestCase, override_settings
+from django.utils import timezone
 
 from workspace.files.models import File
 from workspace.files.services import FileService
+from workspace.files.views import FileViewSet
 from workspace.files.webdav import dc as dc_module
 from workspace.files.webdav.dc import DjangoBasicDomainController
 from workspace.files.webdav.provider import WorkspaceDAVProvider
@@ -26,22 +32,51 @@ from workspace.files.webdav.resources import (
 User = get_user_model()
 
 
-def _make_environ(user=None, **extra):
-    """Build a minimal WSGI environ dict for resource/provider tests."""
-    env = {
+_DEFAULT_ENVIRON = MappingProxyType(
+    {
         "REQUEST_METHOD": "GET",
         "SCRIPT_NAME": "",
         "PATH_INFO": "/",
         "SERVER_NAME": "testserver",
         "SERVER_PORT": "80",
         "HTTP_HOST": "testserver",
-        "wsgi.input": io.BytesIO(b""),
         "wsgidav.provider": None,
     }
+)
+
+
+def _make_environ(user=None, **extra):
+    """Build a minimal WSGI environ for resource/provider tests.
+
+    The shared defaults are read-only; writes (including the provider's
+    per-request memo) land in the front map, private to this environ.
+    """
+    overlay = {"wsgi.input": io.BytesIO(b"")}
     if user is not None:
-        env["workspace.user"] = user
-    env.update(extra)
-    return env
+        overlay["workspace.user"] = user
+    overlay.update(extra)
+    return ChainMap(overlay, _DEFAULT_ENVIRON)
+
+
+def _bulk_create_files(owner, parent, names):
+    """Insert empty sibling files in a single query.
+
+    For fixtures that only need rows (listings), not content or events.
+    ``bulk_create`` skips ``File.save()``, so the materialized ``path`` that
+    WebDAV resolution relies on is filled in here.
+    """
+    prefix = f"{parent.path}/" if parent is not None else ""
+    return File.objects.bulk_create(
+        File(
+            owner=owner,
+            parent=parent,
+            name=name,
+            node_type=File.NodeType.FILE,
+            path=prefix + name,
+            mime_type="text/plain",
+        )
+        for name in names
+    )
 
 
 # ── Domain Controller ─────────────────────────────────────────────────
@@ -122,6 +157,32 @@ class DomainControllerTests(TestCase):
             self.dc.basic_auth_user("Workspace", "davdc", "wrong", environ)
         )
 
+    def test_auth_cache_is_bounded(self):
+        """Distinct credentials must not grow the cache without limit."""
+        from unittest import mock
+
+        for i in range(3):
+            User.objects.create_user(username=f"davdc{i}", password="pw")
+        with mock.patch.object(dc_module, "_AUTH_CACHE_MAX", 2):
+            for i in range(3):
+                self.assertTrue(
+                    self.dc.basic_auth_user("Workspace", f"davdc{i}", "pw", {})
+                )
+        self.assertEqual(len(dc_module._auth_cache), 2)
+        self.assertNotIn(dc_module._cache_key("davdc0", "pw"), dc_module._auth_cache)
+
+    def test_expired_entries_pruned_on_insert(self):
+        from unittest import mock
+
+        User.objects.create_user(username="davdc_other", password="pw")
+        self.dc.basic_auth_user("Workspace", "davdc", "secret123", {})
+        later = dc_module.time.monotonic() + dc_module._AUTH_TTL + 1
+        with mock.patch.object(dc_module.time, "monotonic", return_value=later):
+            self.dc.basic_auth_user("Workspace", "davdc_other", "pw", {})
+        self.assertEqual(
+            list(dc_module._auth_cache), [dc_module._cache_key("davdc_other", "pw")]
+        )
+
 
 # ── Provider ──────────────────────────────────────────────────────────
 
@@ -163,6 +224,66 @@ class ProviderTests(TestCase):
         res = self.provider.get_resource_inst("/A/b.txt", self.environ)
         self.assertIsInstance(res, FileResource)
 
+    def test_doubled_slashes_in_path_are_ignored(self):
+        folder = FileService.create_folder(self.user, "A")
+        FileService.create_file(
+            self.user, "b.txt", parent=folder, mime_type="text/plain"
+        )
+        res = self.provider.get_resource_inst("/A//b.txt", self.environ)
+        self.assertIsInstance(res, FileResource)
+        self.assertEqual(res._file.name, "b.txt")
+
+    def test_resolved_file_has_parent_and_owner_loaded(self):
+        folder = FileService.create_folder(self.user, "A")
+        FileService.create_file(
+            self.user, "b.txt", parent=folder, mime_type="text/plain"
+        )
+        res = self.provider.get_resource_inst("/A/b.txt", self.environ)
+        with self.assertNumQueries(0):
+            self.assertEqual(res._file.parent, folder)
+            self.assertEqual(res._file.owner, self.user)
+
+    def test_stale_leaf_path_resolved_by_name_under_parent(self):
+        folder = FileService.create_folder(self.user, "A")
+        f = FileService.create_file(
+            self.user, "b.txt", parent=folder, mime_type="text/plain"
+        )
+        File.objects.filter(pk=f.pk).update(path="outdated/b.txt")
+        # Primary path lookup misses, the fallback costs a single query.
+        with self.assertNumQueries(2):
+            res = self.provider.get_resource_inst("/A/b.txt", self.environ)
+        self.assertIsInstance(res, FileResource)
+        self.assertEqual(res._file.pk, f.pk)
+
+    def test_stale_root_path_resolved_by_name(self):
+        f = FileService.create_file(self.user, "top.txt", mime_type="text/plain")
+        File.objects.filter(pk=f.pk).update(path="outdated")
+        res = self.provider.get_resource_inst("/top.txt", self.environ)
+        self.assertEqual(res._file.pk, f.pk)
+
+    def test_stale_path_fallback_skips_deleted_parent(self):
+        folder = FileService.create_folder(self.user, "A")
+        f = FileService.create_file(
+            self.user, "b.txt", parent=folder, mime_type="text/plain"
+        )
+        File.objects.filter(pk=f.pk).update(path="outdated/b.txt")
+        File.objects.filter(pk=folder.pk).update(deleted_at=timezone.now())
+        self.assertIsNone(self.provider.get_resource_inst("/A/b.txt", self.environ))
+
+    def test_repeated_resolution_within_request_is_memoized(self):
+        FileService.create_folder(self.user, "A")
+        first = self.provider.get_resource_inst("/A", self.environ)
+        with self.assertNumQueries(0):
+            again = self.provider.get_resource_inst("/A/", self.environ)
+        self.assertIs(again, first)
+
+    def test_memoized_miss_dropped_after_resource_creates_child(self):
+        self.assertIsNone(self.provider.get_resource_inst("/New", self.environ))
+        root = self.provider.get_resource_inst("/", self.environ)
+        root.create_collection("New")
+        res = self.provider.get_resource_inst("/New", self.environ)
+        self.assertIsInstance(res, FolderResource)
+
     def test_soft_deleted_file_not_resolved(self):
         f = FileService.create_file(self.user, "gone.txt", mime_type="text/plain")
         f.soft_delete()
@@ -263,6 +384,36 @@ class RootCollectionTests(TestCase):
     def test_get_member_missing(self):
         self.assertIsNone(self.root.get_member("nope"))
 
+    def test_get_member_served_from_prefetched_names(self):
+        """PROPFIND asks for every member by name after listing the names:
+        that must not cost one query per child."""
+        FileService.create_folder(self.user, "A")
+        FileService.create_file(self.user, "b.txt", mime_type="text/plain")
+        names = self.root.get_member_names()
+        with self.assertNumQueries(1):
+            members = {name: self.root.get_member(name) for name in names}
+        self.assertIsInstance(members["A"], FolderResource)
+        self.assertIsInstance(members["b.txt"], FileResource)
+
+    def test_member_names_plucked_in_one_query(self):
+        FileService.create_folder(self.user, "A")
+        FileService.create_file(self.user, "b.txt", mime_type="text/plain")
+        with self.assertNumQueries(1):
+            names = self.root.get_member_names()
+        self.assertCountEqual(names, ["A", "b.txt"])
+        self.assertIsNone(self.root._members_cache)
+
+    def test_member_names_reuse_populated_cache(self):
+        FileService.create_folder(self.user, "A")
+        self.root.get_member_list()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.root.get_member_names(), ["A"])
+
+    def test_create_collection_refreshes_members(self):
+        self.assertEqual(self.root.get_member_names(), [])
+        self.root.create_collection("Fresh")
+        self.assertEqual(self.root.get_member_names(), ["Fresh"])
+
     def test_create_empty_resource(self):
         res = self.root.create_empty_resource("new.txt")
         self.assertIsInstance(res, FileResource)
@@ -342,6 +493,49 @@ class FolderResourceTests(TestCase):
         self.assertIsInstance(self.res.get_member("D"), FolderResource)
         self.assertIsNone(self.res.get_member("nope"))
 
+    def test_member_properties_need_no_extra_query(self):
+        """Listed members answer PROPFIND without loading deferred columns."""
+        FileService.create_file(
+            self.user,
+            "f.txt",
+            parent=self.folder,
+            content=ContentFile(b"data", name="f.txt"),
+            mime_type="text/plain",
+        )
+        FileService.create_folder(self.user, "D", parent=self.folder)
+        members = self.res.get_member_list()
+        with self.assertNumQueries(0):
+            for member in members:
+                member.get_display_info()
+                member.get_creation_date()
+                member.get_last_modified()
+                if not member.is_collection:
+                    member.get_content_length()
+                    member.get_content_type()
+                    member.get_etag()
+
+    def test_large_folder_listing_is_a_single_query(self):
+        names = [f"f{i:03}.txt" for i in range(50)]
+        _bulk_create_files(self.user, self.folder, names)
+        with self.assertNumQueries(1):
+            members = self.res.get_member_list()
+            sizes = [member.get_content_length() for member in members]
+        self.assertEqual(len(sizes), 50)
+        self.assertCountEqual(self.res.get_member_names(), names)
+
+    def test_listed_member_content_still_readable(self):
+        FileService.create_file(
+            self.user,
+            "f.txt",
+            parent=self.folder,
+            content=ContentFile(b"data", name="f.txt"),
+            mime_type="text/plain",
+        )
+        member = self.res.get_member("f.txt")
+        self.assertIn("content", member._file.get_deferred_fields())
+        with member.get_content() as stream:
+            self.assertEqual(stream.read(), b"data")
+
     def test_create_empty_resource(self):
         res = self.res.create_empty_resource("new.txt")
         self.assertIsInstance(res, FileResource)
@@ -641,6 +835,18 @@ class FileResourceTests(TestCase):
         stream.close()
         self.assertEqual(data, b"hello world")
 
+    def test_get_content_streams_from_storage(self):
+        """GET and range requests read the storage handle in blocks; the
+        body must never be buffered into memory up front."""
+        stream = self.res.get_content()
+        try:
+            self.assertNotIsInstance(stream, io.BytesIO)
+            self.assertEqual(stream.read(5), b"hello")
+            stream.seek(6)
+            self.assertEqual(stream.read(), b"world")
+        finally:
+            stream.close()
+
     def test_get_content_empty_file(self):
         empty = FileService.create_file(self.user, "empty.txt", mime_type="text/plain")
         res = FileResource("/empty.txt", self.environ, empty)
@@ -819,6 +1025,19 @@ class FileResourceTests(TestCase):
         new_full_path = os.path.join(self._tmpdir, self.file.content.name)
         self.assertTrue(os.path.isfile(new_full_path))
 
+    def test_move_rename_in_place_does_not_load_parent(self):
+        """Deciding whether a MOVE re-parents compares ids only."""
+        folder = FileService.create_folder(self.user, "Dir")
+        FileService.create_file(
+            self.user, "a.txt", parent=folder, mime_type="text/plain"
+        )
+        fresh = File.objects.get(parent=folder, name="a.txt")
+        res = FileResource("/Dir/a.txt", self.environ, fresh)
+        res.copy_move_single("/Dir/b.txt", is_move=True)
+        self.assertFalse(File._meta.get_field("parent").is_cached(fresh))
+        fresh.refresh_from_db()
+        self.assertEqual((fresh.name, fresh.parent_id), ("b.txt", folder.pk))
+
     def test_copy_move_single_move_migrates_content_storage(self):
         """A WebDAV MOVE on a file must migrate its bytes on disk.
 
@@ -862,6 +1081,15 @@ class FileResourceTests(TestCase):
         etag = self.res.get_etag()
         self.assertIn(str(self.file.uuid), etag)
 
+    def test_get_etag_reads_only_row_metadata(self):
+        with self.assertNumQueries(0):
+            etag = self.res.get_etag()
+        self.file.updated_at += timedelta(seconds=1)
+        self.assertNotEqual(self.res.get_etag(), etag)
+
+    def test_get_etag_matches_content_endpoint(self):
+        self.assertEqual(f'"{self.res.get_etag()}"', FileViewSet._file_etag(self.file))
+
     def test_support_recursive_move_false(self):
         self.assertFalse(self.res.support_recursive_move("/x"))
 
@@ -893,6 +1121,35 @@ class ResolveParentTests(TestCase):
         b = FileService.create_folder(self.user, "B", parent=a)
         self.assertEqual(_resolve_parent(self.user, ["A", "B"]), b)
 
+    def test_deep_path_resolved_in_single_query(self):
+        """Resolution cost must not grow with the depth of the path."""
+        parent = None
+        for name in ("A", "B", "C", "D", "E"):
+            parent = FileService.create_folder(self.user, name, parent=parent)
+        with self.assertNumQueries(1):
+            resolved = _resolve_parent(self.user, ["A", "B", "C", "D", "E"])
+        self.assertEqual(resolved, parent)
+
+    def test_found_folder_memoized_for_the_request(self):
+        folder = FileService.create_folder(self.user, "A")
+        environ = _make_environ(user=self.user)
+        _resolve_parent(self.user, ["A"], environ=environ)
+        with self.assertNumQueries(0):
+            self.assertEqual(_resolve_parent(self.user, ["A"], environ=environ), folder)
+
+    def test_miss_not_memoized(self):
+        environ = _make_environ(user=self.user)
+        self.assertIsNone(_resolve_parent(self.user, ["A"], environ=environ))
+        folder = FileService.create_folder(self.user, "A")
+        self.assertEqual(_resolve_parent(self.user, ["A"], environ=environ), folder)
+
+    def test_memo_dropped_when_a_folder_is_deleted(self):
+        folder = FileService.create_folder(self.user, "A")
+        environ = _make_environ(user=self.user)
+        _resolve_parent(self.user, ["A"], environ=environ)
+        FolderResource("/A", environ, folder).delete()
+        self.assertIsNone(_resolve_parent(self.user, ["A"], environ=environ))
+
     def test_nonexistent_returns_none(self):
         self.assertIsNone(_resolve_parent(self.user, ["X"]))
 
@@ -987,6 +1244,17 @@ class StreamingWriteBufferTests(TestCase):
         with open(path, "rb") as f:
             self.assertEqual(f.read(), b"12345678ABCD")
 
+    def test_reused_caller_buffer_does_not_corrupt_pending_data(self):
+        """A server may recycle the buffer it passed to write(); bytes not
+        yet flushed must not change with it."""
+        buf, path = self._make_buf()
+        chunk = bytearray(b"first")
+        buf.write(chunk)
+        chunk[:] = b"XXXXX"
+        buf.finalize()
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"first")
+
     def test_flush_survives_partial_os_write(self):
         """POSIX allows os.write to write fewer bytes than requested; the
         flush must loop until the whole buffer is on disk or bytes are
@@ -1103,6 +1371,12 @@ def _basic_auth_header(username, password):
     return f"Basic {cred}"
 
 
+@functools.cache
+def _wsgi_header_key(header):
+    """Return the environ key for an HTTP header (``Content-Type`` -> ``HTTP_CONTENT_TYPE``)."""
+    return "HTTP_" + header.upper().replace("-", "_")
+
+
 class WebDAVIntegrationTests(TestCase):
     """End-to-end tests hitting the WsgiDAV app through the WSGI dispatch.
 
@@ -1110,6 +1384,17 @@ class WebDAVIntegrationTests(TestCase):
     because ``_StreamingWriteBuffer`` needs ``storage.path()``.
     """
 
+    # Request-invariant part of the environ; ``_request`` copies it and
+    # adds the per-call keys (the streams must be fresh for every call).
+    _BASE_ENV = {
+        "SCRIPT_NAME": "/dav",
+        "SERVER_NAME": "testserver",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": "testserver",
+        "wsgi.url_scheme": "http",
+    }
+
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
@@ -1117,6 +1402,14 @@ class WebDAVIntegrationTests(TestCase):
 
         cls._app = create_webdav_app()
 
+    @classmethod
+    def setUpTestData(cls):
+        # Created once per class (each test runs in a savepoint) instead of
+        # paying the password hash and INSERT before every test.
+        cls.user = User.objects.create_user(
+            username="davint", email="int@test.com", password="pass123"
+        )
+
     def setUp(self):
         import tempfile
 
@@ -1124,9 +1417,6 @@ class WebDAVIntegrationTests(TestCase):
         self._media_override = override_settings(MEDIA_ROOT=self._tmpdir)
         self._media_override.enable()
 
-        self.user = User.objects.create_user(
-            username="davint", email="int@test.com", password="pass123"
-        )
         self.auth = _basic_auth_header("davint", "pass123")
 
     def tearDown(self):
@@ -1143,25 +1433,21 @@ class WebDAVIntegrationTests(TestCase):
         ``content_length`` overrides the announced Content-Length to
         simulate interrupted transfers (body shorter than announced).
         """
-        env = {
-            "REQUEST_METHOD": method,
-            "SCRIPT_NAME": "/dav",
-            "PATH_INFO": path,
-            "SERVER_NAME": "testserver",
-            "SERVER_PORT": "80",
-            "SERVER_PROTOCOL": "HTTP/1.1",
-            "HTTP_HOST": "testserver",
-            "wsgi.input": io.BytesIO(body),
-            "wsgi.errors": io.BytesIO(),
-            "wsgi.url_scheme": "http",
-            "CONTENT_LENGTH": (
-                str(len(body)) if content_length is None else content_length
-            ),
-        }
+        env = self._BASE_ENV.copy()
+        env.update(
+            {
+                "REQUEST_METHOD": method,
+                "PATH_INFO": path,
+                "wsgi.input": io.BytesIO(body),
+                "wsgi.errors": io.BytesIO(),
+                "CONTENT_LENGTH": (
+                    str(len(body)) if content_length is None else content_length
+                ),
+            }
+        )
         if headers:
             for key, value in headers.items():
-                wsgi_key = "HTTP_" + key.upper().replace("-", "_")
-                env[wsgi_key] = value
+                env[_wsgi_header_key(key)] = value
         # Authorization goes into HTTP_AUTHORIZATION
         if "HTTP_AUTHORIZATION" not in env and self.auth:
             env["HTTP_AUTHORIZATION"] = self.auth
@@ -1183,6 +1469,15 @@ class WebDAVIntegrationTests(TestCase):
         status_code = int(captured["status"].split(" ", 1)[0])
         return status_code, dict(captured["headers"]), body_out
 
+    def _live_nodes(self):
+        """Return the user's live nodes keyed by path, fetched in one query."""
+        return {
+            row["path"]: row
+            for row in File.objects.filter(
+                owner=self.user, deleted_at__isnull=True
+            ).values("path", "uuid", "parent_id", "node_type", "size")
+        }
+
     # ── auth ──
 
     def test_unauthenticated_returns_401(self):
@@ -1407,24 +1702,13 @@ class WebDAVIntegrationTests(TestCase):
         )
         self.assertIn(code, (201, 204))
 
+        nodes = self._live_nodes()
         # Old location gone
-        self.assertFalse(
-            File.objects.filter(
-                owner=self.user,
-                name="src.txt",
-                parent__isnull=True,
-                deleted_at__isnull=True,
-            ).exists()
-        )
+        self.assertNotIn("src.txt", nodes)
         # New location exists
-        dest = File.objects.get(owner=self.user, name="Dest")
-        moved = File.objects.get(
-            owner=self.user,
-            name="src.txt",
-            parent=dest,
-            deleted_at__isnull=True,
-        )
-        self.assertEqual(moved.size, 7)
+        moved = nodes["Dest/src.txt"]
+        self.assertEqual(moved["parent_id"], nodes["Dest"]["uuid"])
+        self.assertEqual(moved["size"], 7)
 
     def test_move_folder(self):
         folder = FileService.create_folder(self.user, "ToMove")
@@ -1442,19 +1726,11 @@ class WebDAVIntegrationTests(TestCase):
             headers={"Destination": "http://testserver/dav/Into/ToMove/"},
         )
         self.assertIn(code, (201, 204))
-        into = File.objects.get(owner=self.user, name="Into")
-        moved = File.objects.get(
-            owner=self.user,
-            name="ToMove",
-            parent=into,
-            deleted_at__isnull=True,
-        )
+        nodes = self._live_nodes()
+        moved = nodes["Into/ToMove"]
+        self.assertEqual(moved["parent_id"], nodes["Into"]["uuid"])
         # Child should follow
-        self.assertTrue(
-            File.objects.filter(
-                parent=moved, name="child.txt", deleted_at__isnull=True
-            ).exists()
-        )
+        self.assertEqual(nodes["Into/ToMove/child.txt"]["parent_id"], moved["uuid"])
 
     def test_move_file_rename_in_place(self):
         """MOVE with same parent and new name = rename."""
@@ -1468,19 +1744,9 @@ class WebDAVIntegrationTests(TestCase):
             headers={"Destination": "http://testserver/dav/new.txt"},
         )
         self.assertIn(code, (201, 204))
-        self.assertFalse(
-            File.objects.filter(
-                owner=self.user,
-                name="old.txt",
-                deleted_at__isnull=True,
-            ).exists()
-        )
-        renamed = File.objects.get(
-            owner=self.user,
-            name="new.txt",
-            deleted_at__isnull=True,
-        )
-        self.assertIsNone(renamed.parent)
+        nodes = self._live_nodes()
+        self.assertNotIn("old.txt", nodes)
+        self.assertIsNone(nodes["new.txt"]["parent_id"])
 
     def test_move_folder_rename_in_place(self):
         """MOVE on a folder with same parent and new name = rename."""
@@ -1491,21 +1757,9 @@ class WebDAVIntegrationTests(TestCase):
             headers={"Destination": "http://testserver/dav/New/"},
         )
         self.assertIn(code, (201, 204))
-        self.assertFalse(
-            File.objects.filter(
-                owner=self.user,
-                name="Old",
-                deleted_at__isnull=True,
-            ).exists()
-        )
-        self.assertTrue(
-            File.objects.filter(
-                owner=self.user,
-                name="New",
-                node_type=File.NodeType.FOLDER,
-                deleted_at__isnull=True,
-            ).exists()
-        )
+        nodes = self._live_nodes()
+        self.assertNotIn("Old", nodes)
+        self.assertEqual(nodes["New"]["node_type"], File.NodeType.FOLDER)
 
     def test_move_file_subfolder_to_root(self):
         """MOVE a file from a subfolder back to the root collection."""
@@ -1523,20 +1777,9 @@ class WebDAVIntegrationTests(TestCase):
             headers={"Destination": "http://testserver/dav/x.txt"},
         )
         self.assertIn(code, (201, 204))
-        moved = File.objects.get(
-            owner=self.user,
-            name="x.txt",
-            deleted_at__isnull=True,
-        )
-        self.assertIsNone(moved.parent)
-        self.assertFalse(
-            File.objects.filter(
-                owner=self.user,
-                name="x.txt",
-                parent=sub,
-                deleted_at__isnull=True,
-            ).exists()
-        )
+        nodes = self._live_nodes()
+        self.assertIsNone(nodes["x.txt"]["parent_id"])
+        self.assertNotIn("Sub/x.txt", nodes)
 
     def test_move_file_between_sibling_folders(self):
         """MOVE a file from one folder to a sibling folder."""
@@ -1555,20 +1798,9 @@ class WebDAVIntegrationTests(TestCase):
             headers={"Destination": "http://testserver/dav/B/doc.txt"},
         )
         self.assertIn(code, (201, 204))
-        moved = File.objects.get(
-            owner=self.user,
-            name="doc.txt",
-            deleted_at__isnull=True,
-        )
-        self.assertEqual(moved.parent, b)
-        self.assertFalse(
-            File.objects.filter(
-                owner=self.user,
-                name="doc.txt",
-                parent=a,
-                deleted_at__isnull=True,
-            ).exists()
-        )
+        nodes = self._live_nodes()
+        self.assertEqual(nodes["B/doc.txt"]["parent_id"], b.pk)
+        self.assertNotIn("A/doc.txt", nodes)
 
     def test_move_file_with_rename_to_other_folder(self):
         """MOVE that combines a parent change and a name change."""
@@ -1587,21 +1819,11 @@ class WebDAVIntegrationTests(TestCase):
             headers={"Destination": "http://testserver/dav/B/new.txt"},
         )
         self.assertIn(code, (201, 204))
-        moved = File.objects.get(
-            owner=self.user,
-            name="new.txt",
-            parent=b,
-            deleted_at__isnull=True,
-        )
-        self.assertEqual(moved.size, 1)
-        self.assertFalse(
-            File.objects.filter(
-                owner=self.user,
-                name="old.txt",
-                parent=a,
-                deleted_at__isnull=True,
-            ).exists()
-        )
+        nodes = self._live_nodes()
+        moved = nodes["B/new.txt"]
+        self.assertEqual(moved["parent_id"], b.pk)
+        self.assertEqual(moved["size"], 1)
+        self.assertNotIn("A/old.txt", nodes)
 
     def test_move_overwrite_default_replaces_destination(self):
         """MOVE without ``Overwrite`` header defaults to overwrite (RFC 4918 §10.6)."""
@@ -1662,20 +1884,9 @@ class WebDAVIntegrationTests(TestCase):
         )
         self.assertEqual(code, 412)
         # Both files must still exist, untouched.
-        self.assertTrue(
-            File.objects.filter(
-                owner=self.user,
-                name="src.txt",
-                deleted_at__isnull=True,
-            ).exists()
-        )
-        self.assertTrue(
-            File.objects.filter(
-                owner=self.user,
-                name="dest.txt",
-                deleted_at__isnull=True,
-            ).exists()
-        )
+        nodes = self._live_nodes()
+        self.assertIn("src.txt", nodes)
+        self.assertIn("dest.txt", nodes)
 
     # ── COPY ──
 
@@ -4,8 +4,11 @@ from . import views
 
 app_name = "files_ui"
 
+# Resolution scans these in order. Folder navigation is the bulk of the
+# traffic, and the uuid converter cannot match any of the literal routes.
 urlpatterns = [
     path("", views.index, name="index"),
+    path("/<uuid:folder>", views.index, name="folder"),
     path("/trash", views.trash, name="trash"),
     path("/pinned", views.pinned_folders, name="pinned_folders"),
     path("/group-folders", views.group_folders_sidebar, name="group_folders_sidebar"),
@@ -14,5 +17,4 @@ urlpatterns = [
     path("/<uuid:uuid>/card", views.file_card, name="file_card"),
     path("/view/<uuid:uuid>", views.view_file, name="view_file"),
     path("/shared/<str:token>", views.shared_file_view, name="shared_file"),
-    path("/<uuid:folder>", views.index, name="folder"),
 ]
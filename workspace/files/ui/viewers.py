@@ -6,6 +6,11 @@ a specific type of file in the browser.
 """
 
 from abc import ABC, abstractmethod
+from functools import cached_property
+
+# Text above this size is not embedded in the rendered viewer: the client
+# fetches it from the streaming content endpoint instead.
+MAX_INLINE_TEXT_BYTES = 512 * 1024
 
 
 class ViewerRegistry:
@@ -62,6 +67,39 @@ class BaseViewer(ABC):
         """Check if this viewer supports editing."""
         return False
 
+    @cached_property
+    def _text_content(self) -> str | None:
+        """File content decoded as UTF-8, or "" for binary or missing content.
+
+        Read through a single open/close, once per viewer instance, and never
+        more than MAX_INLINE_TEXT_BYTES: None means the stored bytes outgrew
+        the limit even though the recorded size did not.
+        """
+        limit = MAX_INLINE_TEXT_BYTES + 1
+        # Sized from the recorded size so a small file doesn't allocate a
+        # limit-sized read buffer; a full read means it may have grown.
+        hint = min(self.file.size or 0, MAX_INLINE_TEXT_BYTES) + 1
+        try:
+            with self.file.content.open("rb") as file_handle:
+                data = file_handle.read(hint)
+                if hint < limit and len(data) == hint:
+                    data += file_handle.read(limit - hint)
+            if len(data) > MAX_INLINE_TEXT_BYTES:
+                return None
+            return data.decode("utf-8")
+        except UnicodeDecodeError, AttributeError:
+            return ""
+
+    def _text_context(self) -> dict:
+        """Context for text-based viewers: content inline, or deferred to
+        ``content_url`` when the file is too large to embed."""
+        content = None
+        if (self.file.size or 0) <= MAX_INLINE_TEXT_BYTES:
+            content = self._text_content
+        if content is None:
+            return {"content": "", "fetch_content": True}
+        return {"content": content, "fetch_content": False}
+
     def get_context(self, request) -> dict:
         """Get context data for template rendering."""
         can_edit = self.can_edit() and getattr(self, "_user_can_edit", True)
@@ -91,24 +129,9 @@ class TextViewer(BaseViewer):
         """Render Monaco Editor for text files."""
         from django.template.loader import render_to_string
 
-        # Read file content
-        file_handle = None
-        try:
-            file_handle = self.file.content.open("rb")
-            content = file_handle.read().decode("utf-8")
-        except UnicodeDecodeError, AttributeError:
-            content = ""
-        finally:
-            if file_handle:
-                file_handle.close()
-
         context = self.get_context(request)
-        context.update(
-            {
-                "language": self._detect_language(),
-                "content": content,
-            }
-        )
+        context.update(self._text_context())
+        context["language"] = self._detect_language()
 
         return render_to_string(
             "files/ui/viewers/text_viewer.html", context, request=request
@@ -203,18 +226,8 @@ class MarkdownViewer(BaseViewer):
         """Render Milkdown Crepe WYSIWYG editor for Markdown files."""
         from django.template.loader import render_to_string
 
-        file_handle = None
-        try:
-            file_handle = self.file.content.open("rb")
-            content = file_handle.read().decode("utf-8")
-        except UnicodeDecodeError, AttributeError:
-            content = ""
-        finally:
-            if file_handle:
-                file_handle.close()
-
         context = self.get_context(request)
-        context["content"] = content
+        context.update(self._text_context())
 
         return render_to_string(
             "files/ui/viewers/markdown_viewer.html", context, request=request
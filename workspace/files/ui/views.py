@@ -1,12 +1,16 @@
+import hashlib
+
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.db.models import Exists, OuterRef, Prefetch, Q, Subquery
+from django.db.models import Exists, OuterRef, Prefetch, Q, Value
 from django.db.models.functions import Lower
 from django.http import Http404, HttpResponse
 from django.shortcuts import render
 from django.utils.html import escape
 from django.views.decorators.csrf import ensure_csrf_cookie
 
+from workspace.common.booleans import is_truthy
+from workspace.common.cache import cached
 from workspace.common.uuids import parse_uuid_or_none
 from workspace.files.services import FilePermission, FileService
 from workspace.files.services.filetype import get_viewer_by_slug
@@ -26,55 +30,93 @@ from .viewers import ViewerRegistry
 RECENT_FILES_LIMIT = getattr(settings, "RECENT_FILES_LIMIT", 25)
 INITIAL_EVENTS_LIMIT = 15
 MAX_EVENTS_LIMIT = 200
+BREADCRUMBS_CACHE_TTL = 3600
+# Columns the listing templates and ``is_viewable`` read; the rest (notably
+# the materialized ``path`` and the storage name) stay in the database.
+_LISTING_FIELDS = (
+    "uuid",
+    "name",
+    "node_type",
+    "type",
+    "mime_type",
+    "size",
+    "icon",
+    "color",
+    "has_thumbnail",
+    "parent",
+    "owner",
+    "group",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+)
 
 
-def build_breadcrumbs(folder, user=None):
-    """Build breadcrumb trail from current folder to root.
+def _crumb(f):
+    return {
+        "label": f.name,
+        "url": f"/files/{f.uuid}",
+        "uuid": f.uuid,
+        "icon": f.icon or "folder",
+        "icon_color": f.color or "text-warning",
+    }
 
-    Uses the denormalized ``path`` field to fetch all ancestors in a single
-    query instead of walking the parent FK chain (which costs 1 query per
-    ancestor level).
-    """
-    path = folder.path or folder.get_path()
-    parts = path.split("/")
 
-    def _crumb(f):
-        return {
-            "label": f.name,
-            "url": f"/files/{f.uuid}",
-            "uuid": f.uuid,
-            "icon": f.icon or "folder",
-            "icon_color": f.color or "text-warning",
-        }
+def _folder_crumbs_key(folder, path):
+    digest = hashlib.md5(path.encode()).hexdigest()[:16]
+    return f"files:crumbs:{folder.uuid}:{digest}"
+
+
+@cached(
+    key=_folder_crumbs_key,
+    ttl=BREADCRUMBS_CACHE_TTL,
+    tags=lambda folder, path: [folder.tree_cache_tag],
+)
+def _folder_crumbs(folder, path):
+    """Crumbs for *folder* and its live ancestors, outermost first.
 
+    Keyed on the folder's path so a rename or move anywhere above it misses
+    the cache; icon/color edits and trash/restore bump the tree tag instead.
+    """
+    parts = path.split("/")
     if len(parts) <= 1:
         # Root-level folder — no ancestors to fetch
-        breadcrumbs = [_crumb(folder)]
+        return [_crumb(folder)]
+
+    # Build ancestor path prefixes: "A", "A/B", … (excluding self)
+    ancestor_paths = ["/".join(parts[:i]) for i in range(1, len(parts))]
+
+    # Scope to same owner+group to avoid cross-user path collisions
+    if folder.group_id:
+        scope = Q(group_id=folder.group_id)
     else:
-        # Build ancestor path prefixes: "A", "A/B", … (excluding self)
-        ancestor_paths = ["/".join(parts[:i]) for i in range(1, len(parts))]
+        scope = Q(owner_id=folder.owner_id, group__isnull=True)
+
+    # Single query for ALL ancestors
+    ancestors = {
+        f.path: f
+        for f in File.objects.filter(
+            scope,
+            path__in=ancestor_paths,
+            node_type=File.NodeType.FOLDER,
+            deleted_at__isnull=True,
+        ).only("uuid", "name", "icon", "color", "path")
+    }
 
-        # Scope to same owner+group to avoid cross-user path collisions
-        if folder.group_id:
-            scope = Q(group_id=folder.group_id)
-        else:
-            scope = Q(owner_id=folder.owner_id, group__isnull=True)
-
-        # Single query for ALL ancestors
-        ancestors = {
-            f.path: f
-            for f in File.objects.filter(
-                scope,
-                path__in=ancestor_paths,
-                node_type=File.NodeType.FOLDER,
-                deleted_at__isnull=True,
-            ).only("uuid", "name", "icon", "color", "path")
-        }
+    crumbs = [_crumb(ancestors[ap]) for ap in ancestor_paths if ap in ancestors]
+    crumbs.append(_crumb(folder))
+    return crumbs
 
-        breadcrumbs = [
-            _crumb(ancestors[ap]) for ap in ancestor_paths if ap in ancestors
-        ]
-        breadcrumbs.append(_crumb(folder))
+
+def build_breadcrumbs(folder, user=None):
+    """Build breadcrumb trail from current folder to root.
+
+    Uses the denormalized ``path`` field to fetch all ancestors in a single
+    query instead of walking the parent FK chain (which costs 1 query per
+    ancestor level), and caches the folder's trail so repeat navigation
+    skips the database entirely.
+    """
+    breadcrumbs = list(_folder_crumbs(folder, folder.path or folder.get_path()))
 
     # Prepend root entry
     if folder.group_id:
@@ -92,7 +134,34 @@ def build_breadcrumbs(folder, user=None):
     return breadcrumbs
 
 
-def _build_context(request, folder=None, is_trash_view=False):
+def _pinned_folders(user):
+    """The user's live pinned folders, each with ``folder.is_favorite`` set.
+
+    Favorite status is annotated via the folder FK in the same query rather
+    than re-fetching the File rows just to attach it.
+    """
+    pins = (
+        PinnedFolder.objects.filter(
+            owner=user,
+            folder__deleted_at__isnull=True,
+        )
+        .select_related("folder")
+        .annotate(
+            _folder_is_favorite=Exists(
+                FileFavorite.objects.filter(
+                    owner=user,
+                    file_id=OuterRef("folder_id"),
+                )
+            ),
+        )
+        .order_by("position", "created_at")
+    )
+    for pin in pins:
+        pin.folder.is_favorite = pin._folder_is_favorite
+    return pins
+
+
+def _build_context(request, folder=None, is_trash_view=False, partial=False):
     current_folder = None
     active_tag = None
     if not is_trash_view and request.GET.get("tag"):
@@ -103,22 +172,20 @@ def _build_context(request, folder=None, is_trash_view=False):
             raise Http404
     is_tag_view = active_tag is not None
     is_shared_view = (
-        not is_trash_view
-        and not is_tag_view
-        and str(request.GET.get("shared", "")).lower() in {"1", "true", "yes"}
+        not is_trash_view and not is_tag_view and is_truthy(request.GET.get("shared"))
     )
     is_favorites_view = (
         not is_trash_view
         and not is_tag_view
         and not is_shared_view
-        and str(request.GET.get("favorites", "")).lower() in {"1", "true", "yes"}
+        and is_truthy(request.GET.get("favorites"))
     )
     is_recent_view = (
         not is_trash_view
         and not is_tag_view
         and not is_favorites_view
         and not is_shared_view
-        and str(request.GET.get("recent", "")).lower() in {"1", "true", "yes"}
+        and is_truthy(request.GET.get("recent"))
     )
     user_label = request.user.get_full_name() or request.user.username
     files_root = {"label": user_label, "url": "/files", "icon": "hard-drive"}
@@ -180,17 +247,29 @@ def _build_context(request, folder=None, is_trash_view=False):
                 owner=request.user,
                 deleted_at__isnull=False,
             )
-            .filter(Q(parent__isnull=True) | Q(parent__deleted_at__isnull=True))
+            # Only trash roots: hide items whose parent is itself trashed.
+            # NOT EXISTS plans as an anti-join, unlike an OR across a LEFT JOIN.
+            .exclude(
+                Exists(
+                    File.objects.filter(
+                        pk=OuterRef("parent_id"), deleted_at__isnull=False
+                    )
+                )
+            )
             .name_ordered("-deleted_at")
         )
     elif is_favorites_view:
+        # Neither the favorite nor the access check joins a multi-valued
+        # relation, so rows can't repeat and no DISTINCT is needed.
         nodes = (
             File.objects.filter(
-                FileService.accessible_files_q(request.user),
-                deleted_at__isnull=True,
-                favorites__owner=request.user,
+                pk__in=FileFavorite.objects.filter(owner=request.user).values("file_id")
+            )
+            .filter(
+                pk__in=FileService.accessible_file_ids(
+                    request.user, include_deleted=False
+                )
             )
-            .distinct()
             .name_ordered("-node_type")
         )
     elif is_recent_view:
@@ -222,34 +301,37 @@ def _build_context(request, folder=None, is_trash_view=False):
             .name_ordered("-node_type")
         )
 
-    favorite_subquery = FileFavorite.objects.filter(
-        owner=request.user,
-        file_id=OuterRef("pk"),
+    # The favorites listing is already filtered on the viewer's favorites;
+    # re-probing them per row would only ever answer True.
+    is_favorite = (
+        Value(True)
+        if is_favorites_view
+        else Exists(
+            FileFavorite.objects.filter(
+                owner=request.user,
+                file_id=OuterRef("pk"),
+            )
+        )
     )
     pinned_subquery = PinnedFolder.objects.filter(
         owner=request.user,
         folder_id=OuterRef("pk"),
     )
-    is_shared_subquery = FileShare.objects.filter(
-        file_id=OuterRef("pk"),
-    )
-    user_share_subquery = FileShare.objects.filter(
-        file_id=OuterRef("pk"),
-        shared_with=request.user,
-    ).values("permission")[:1]
-    nodes = nodes.annotate(
-        is_favorite=Exists(favorite_subquery),
-        is_pinned=Exists(pinned_subquery),
-        is_shared=Exists(is_shared_subquery),
-        user_share_permission=Subquery(user_share_subquery),
-    ).prefetch_related(
-        # Scoped to the viewer's own tags: the shared-with-me listing shows
-        # other people's files, and their tags must never leak into it.
-        Prefetch(
-            "file_tags",
-            queryset=FileTag.objects.filter(tag__owner=request.user)
-            .select_related("tag")
-            .order_by(Lower("tag__name")),
+    nodes = (
+        nodes.only(*_LISTING_FIELDS)
+        .annotate(
+            is_favorite=is_favorite,
+            is_pinned=Exists(pinned_subquery),
+        )
+        .prefetch_related(
+            # Scoped to the viewer's own tags: the shared-with-me listing shows
+            # other people's files, and their tags must never leak into it.
+            Prefetch(
+                "file_tags",
+                queryset=FileTag.objects.filter(tag__owner=request.user)
+                .select_related("tag")
+                .order_by(Lower("tag__name")),
+            )
         )
     )
     if is_recent_view:
@@ -264,6 +346,9 @@ def _build_context(request, folder=None, is_trash_view=False):
     # those, so it never lists tags that would match nothing here.
     listing_tags = {}
     for node in nodes:
+        # Resolved once here: the table and mosaic layouts test it several
+        # times per row, and each call walks the viewer registry.
+        node.viewable = node.is_viewable()
         if node.node_type == File.NodeType.FILE:
             folder_stats["file_count"] += 1
             folder_stats["total_size"] += node.size or 0
@@ -318,45 +403,28 @@ def _build_context(request, folder=None, is_trash_view=False):
         empty_title = None
         empty_message = None
 
-    # Group folders the user has access to
-    group_folders = (
-        FileService.user_group_files_qs(request.user)
-        .filter(
-            parent__isnull=True,
-            node_type=File.NodeType.FOLDER,
+    # The sidebar sits outside the #folder-browser partial: Alpine
+    # navigations re-render only the listing, so skip loading it for them.
+    group_folders = available_groups = pinned_folders_qs = None
+    if not partial:
+        # Group folders the user has access to
+        group_folders = (
+            FileService.user_group_files_qs(request.user)
+            .filter(
+                parent__isnull=True,
+                node_type=File.NodeType.FOLDER,
+            )
+            .select_related("group")
+            .name_ordered()
         )
-        .select_related("group")
-        .name_ordered()
-    )
-
-    # Groups without a folder yet (for "Create group folder" action)
-    groups_with_folders = group_folders.values_list("group_id", flat=True)
-    available_groups = request.user.groups.exclude(id__in=groups_with_folders).order_by(
-        Lower("name")
-    )
 
-    # Load pinned folders + their favorite status in a single query:
-    # annotate via the FK (folder_id) rather than re-fetching the File rows.
-    pinned_folders_qs = (
-        PinnedFolder.objects.filter(
-            owner=request.user,
-            folder__deleted_at__isnull=True,
-        )
-        .select_related("folder")
-        .annotate(
-            _folder_is_favorite=Exists(
-                FileFavorite.objects.filter(
-                    owner=request.user,
-                    file_id=OuterRef("folder_id"),
-                )
-            ),
-        )
-        .order_by("position", "created_at")
-    )
+        # Groups without a folder yet (for "Create group folder" action)
+        groups_with_folders = group_folders.values_list("group_id", flat=True)
+        available_groups = request.user.groups.exclude(
+            id__in=groups_with_folders
+        ).order_by(Lower("name"))
 
-    pinned_folder_ids = [p.folder_id for p in pinned_folders_qs]
-    for pin in pinned_folders_qs:
-        pin.folder.is_favorite = pin._folder_is_favorite
+        pinned_folders_qs = _pinned_folders(request.user)
 
     parent_url = breadcrumbs[-2].get("url", "/files") if len(breadcrumbs) >= 2 else None
 
@@ -373,7 +441,15 @@ def _build_context(request, folder=None, is_trash_view=False):
     elif current_folder:
         # Check if current folder or any ancestor is a pinned folder.
         # Iterate self → root (reversed) to find the deepest pinned ancestor.
-        pinned_ids = set(pinned_folder_ids) if pinned_folder_ids else set()
+        if pinned_folders_qs is not None:
+            pinned_ids = {pin.folder_id for pin in pinned_folders_qs}
+        else:
+            pinned_ids = set(
+                PinnedFolder.objects.filter(
+                    owner=request.user,
+                    folder_id__in=[bc["uuid"] for bc in breadcrumbs if "uuid" in bc],
+                ).values_list("folder_id", flat=True)
+            )
         sidebar_active = "root"
         for bc in reversed(breadcrumbs):
             bc_uuid = bc.get("uuid")
@@ -432,9 +508,12 @@ def _build_context(request, folder=None, is_trash_view=False):
 @ensure_csrf_cookie
 def index(request, folder=None):
     """File browser view with optional folder navigation."""
-    context = _build_context(request, folder=folder, is_trash_view=False)
+    partial = bool(request.headers.get("X-Alpine-Request"))
+    context = _build_context(
+        request, folder=folder, is_trash_view=False, partial=partial
+    )
 
-    if request.headers.get("X-Alpine-Request"):
+    if partial:
         return render(request, "files/ui/index.html#folder-browser", context)
 
     return render(request, "files/ui/index.html", context)
@@ -444,9 +523,10 @@ def index(request, folder=None):
 @ensure_csrf_cookie
 def trash(request):
     """Trash view for deleted files and folders."""
-    context = _build_context(request, is_trash_view=True)
+    partial = bool(request.headers.get("X-Alpine-Request"))
+    context = _build_context(request, is_trash_view=True, partial=partial)
 
-    if request.headers.get("X-Alpine-Request"):
+    if partial:
         return render(request, "files/ui/index.html#folder-browser", context)
 
     return render(request, "files/ui/index.html", context)
@@ -457,8 +537,22 @@ def properties(request, uuid):
     """Return file/folder properties partial for the properties modal."""
     from django.db.models import Sum
 
-    # Try as owner first, then as shared recipient
-    file_obj = File.objects.filter(uuid=uuid, deleted_at__isnull=True).first()
+    # Favorite/pinned state rides along on the file fetch. Only folders can
+    # be pinned, so the pinned probe is simply false for files.
+    file_obj = (
+        File.objects.filter(uuid=uuid, deleted_at__isnull=True)
+        .annotate(
+            _is_favorite=Exists(
+                FileFavorite.objects.filter(owner=request.user, file_id=OuterRef("pk"))
+            ),
+            _is_pinned=Exists(
+                PinnedFolder.objects.filter(
+                    owner=request.user, folder_id=OuterRef("pk")
+                )
+            ),
+        )
+        .first()
+    )
     if not file_obj:
         raise Http404
 
@@ -466,18 +560,8 @@ def properties(request, uuid):
     if perm is None:
         raise Http404
     is_owner = perm >= FilePermission.MANAGE
-
-    # Check if favorite
-    is_favorite = FileFavorite.objects.filter(
-        owner=request.user, file=file_obj
-    ).exists()
-
-    # Check if pinned (folders only)
-    is_pinned = False
-    if file_obj.node_type == File.NodeType.FOLDER:
-        is_pinned = PinnedFolder.objects.filter(
-            owner=request.user, folder=file_obj
-        ).exists()
+    is_favorite = file_obj._is_favorite
+    is_pinned = file_obj._is_pinned
 
     # For folders, get children count and total size
     children_count = 0
@@ -631,28 +715,7 @@ def events(request, uuid):
 @login_required
 def pinned_folders(request):
     """Return pinned folders partial for Alpine AJAX loading."""
-    # Annotate is_favorite via the folder FK in the same query — avoids
-    # the previous double-fetch (one query for the join, a second one to
-    # re-load the same File rows just to attach the annotation).
-    pinned_qs = (
-        PinnedFolder.objects.filter(
-            owner=request.user,
-            folder__deleted_at__isnull=True,
-        )
-        .select_related("folder")
-        .annotate(
-            _folder_is_favorite=Exists(
-                FileFavorite.objects.filter(
-                    owner=request.user,
-                    file_id=OuterRef("folder_id"),
-                )
-            ),
-        )
-        .order_by("position", "created_at")
-    )
-
-    for pin in pinned_qs:
-        pin.folder.is_favorite = pin._folder_is_favorite
+    pinned_qs = _pinned_folders(request.user)
 
     return render(
         request,
@@ -3,7 +3,7 @@ from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import OuterRef, Q, Subquery
+from django.db.models import Q
 from django.db.models.functions import Lower
 from django.http import Http404
 from django.utils import timezone
@@ -21,14 +21,16 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.filters import SearchFilter
 from rest_framework.response import Response
 
+from workspace.common.booleans import is_truthy
 from workspace.common.filters import CaseInsensitiveOrderingFilter
 from workspace.common.mixins import CacheControlMixin
 from workspace.common.uuids import parse_uuid_or_none
+from workspace.files.actions import ActionRegistry
 from workspace.files.services import FilePermission, FileService
 from workspace.notifications.services.notifications import notify, notify_many
 
-from .models import File, FileShare
-from .serializers import FileSerializer
+from .models import File, FileFavorite
+from .serializers import FILE_LIST_COLUMNS, FileSerializer
 from .viewsets.actions import ActionsMixin
 from .viewsets.comments import CommentsMixin
 from .viewsets.content import ContentMixin
@@ -308,25 +310,16 @@ class FileViewSet(
         return queryset.exclude(Q(path=path) | Q(path__startswith=path + "/"))
 
     def _is_favorites_query(self):
-        value = self.request.query_params.get("favorites")
-        if value is None:
-            return False
-        return str(value).lower() in {"1", "true", "yes"}
+        return is_truthy(self.request.query_params.get("favorites"))
 
     def _is_recent_query(self):
-        value = self.request.query_params.get("recent")
-        if value is None:
-            return False
-        return str(value).lower() in {"1", "true", "yes"}
+        return is_truthy(self.request.query_params.get("recent"))
 
     def _is_trash_query(self):
-        value = self.request.query_params.get("trashed")
-        if value is None:
-            return False
-        return str(value).lower() in {"1", "true", "yes"}
+        return is_truthy(self.request.query_params.get("trashed"))
 
     def _is_descendants_query(self):
-        return self.request.query_params.get("descendants", "").lower() in {"1", "true"}
+        return is_truthy(self.request.query_params.get("descendants"))
 
     def _get_recent_limit(self):
         value = self.request.query_params.get("recent_limit")
@@ -346,17 +339,20 @@ class FileViewSet(
         Returns (file_obj, permission).
         Raises Http404 if no access.
         """
-        file_obj = File.objects.filter(uuid=uuid, deleted_at__isnull=True).first()
-        if not file_obj:
-            raise Http404
-        perm = FileService.get_permission(self.request.user, file_obj)
+        file_obj, perm = FileService.get_live_file_with_permission(
+            self.request.user, uuid
+        )
         if perm is None:
             raise Http404
         return file_obj, perm
 
     @staticmethod
     def _file_etag(file_obj):
-        """Deterministic ETag based on UUID and last modification time."""
+        """Deterministic ETag based on UUID and last modification time.
+
+        ``updated_at`` is auto_now, so every content write changes it; the
+        WebDAV ``FileResource.get_etag`` serves the same value unquoted.
+        """
         return f'"{file_obj.uuid}-{file_obj.updated_at.timestamp()}"'
 
     def _check_etag_304(self, request, file_obj):
@@ -380,26 +376,20 @@ class FileViewSet(
 
     def get_queryset(self):
         """Filter by current user's files."""
-        user_share_subquery = FileShare.objects.filter(
-            file_id=OuterRef("pk"),
-            shared_with=self.request.user,
-        ).values("permission")[:1]
-
-        # Favorites: include owned, shared-with-me, and group files
+        # Favorites: include owned, shared-with-me, and group files. Neither
+        # filter joins a multi-valued relation, so no DISTINCT is needed.
         if self.action == "list" and self._is_favorites_query():
-            return (
-                FileService.annotate_for_serializer(
-                    File.objects.filter(
-                        FileService.accessible_files_q(self.request.user),
-                        deleted_at__isnull=True,
-                        favorites__owner=self.request.user,
-                    ),
-                    self.request.user,
-                )
-                .annotate(
-                    user_share_permission=Subquery(user_share_subquery),
-                )
-                .distinct()
+            return FileService.annotate_for_serializer(
+                File.objects.filter(
+                    pk__in=FileFavorite.objects.filter(owner=self.request.user).values(
+                        "file_id"
+                    )
+                ).filter(
+                    pk__in=FileService.accessible_file_ids(
+                        self.request.user, include_deleted=False
+                    )
+                ),
+                self.request.user,
             )
 
         # Resolve parent context: detect group from parent, resolve descendants
@@ -432,17 +422,13 @@ class FileViewSet(
             )
             if ancestor_path:
                 qs = qs.filter(path__startswith=ancestor_path + "/")
-            qs = FileService.annotate_for_serializer(qs, self.request.user).annotate(
-                user_share_permission=Subquery(user_share_subquery),
-            )
-            return qs
+            return FileService.annotate_for_serializer(qs, self.request.user)
 
         queryset = File.objects.filter(owner=self.request.user, group__isnull=True)
-        queryset = FileService.annotate_for_serializer(
-            queryset, self.request.user
-        ).annotate(
-            user_share_permission=Subquery(user_share_subquery),
-        )
+        # The annotations only feed FileSerializer; these actions answer with
+        # a status or a count and never render the file they look up.
+        if self.action not in {"destroy", "restore", "purge"}:
+            queryset = FileService.annotate_for_serializer(queryset, self.request.user)
         if self.action in {"trash"} or self._is_trash_query():
             return queryset.filter(deleted_at__isnull=False)
         if self.action in {"restore", "purge"}:
@@ -497,7 +483,7 @@ class FileViewSet(
         return super().create(request, *args, **kwargs)
 
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.filter_queryset(self.get_queryset()).only(*FILE_LIST_COLUMNS)
 
         # Filter by tags (comma-separated UUIDs)
         tags_param = request.query_params.get("tags")
@@ -575,8 +561,6 @@ class FileViewSet(
         # the standard flow returns 404/403 and we must not preempt it
         # (e.g. a VIEW-only shared user must still see 404, not 403).
         if "name" in request.data:
-            from workspace.files.actions import ActionRegistry
-
             target = File.objects.filter(
                 uuid=uuid,
                 deleted_at__isnull=True,
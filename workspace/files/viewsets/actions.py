@@ -3,7 +3,7 @@
 import logging
 
 from django.conf import settings
-from django.db.models import Exists, OuterRef, Subquery
+from django.db.models import Exists, OuterRef
 from django.http import Http404
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiResponse, extend_schema
@@ -11,6 +11,7 @@ from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from workspace.files.actions import ActionRegistry
 from workspace.files.models import File, FileFavorite, FileShare, PinnedFolder
 from workspace.files.serializers import FileSerializer
 from workspace.files.services import FileService
@@ -53,8 +54,6 @@ class ActionsMixin:
     @action(detail=False, methods=["post"], url_path="actions")
     def files_actions(self, request):
         """Return available actions per file/folder for a set of UUIDs."""
-        from workspace.files.actions import ActionRegistry
-
         uuids = request.data.get("uuids", [])
         if not isinstance(uuids, list) or len(uuids) == 0:
             return Response(
@@ -126,18 +125,9 @@ class ActionsMixin:
             node_type=File.NodeType.FILE,
             deleted_at__isnull=True,
         )
-        queryset = (
-            FileService.annotate_for_serializer(queryset, request.user)
-            .annotate(
-                user_share_permission=Subquery(
-                    FileShare.objects.filter(
-                        file_id=OuterRef("pk"),
-                        shared_with=request.user,
-                    ).values("permission")[:1]
-                ),
-            )
-            .name_ordered()
-        )
+        queryset = FileService.annotate_for_serializer(
+            queryset, request.user
+        ).name_ordered()
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
@@ -5,8 +5,9 @@ from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from workspace.files.actions import ActionRegistry
 from workspace.files.models import File, FileFavorite, PinnedFolder
-from workspace.files.serializers import PinnedReorderSerializer
+from workspace.files.serializers import FILE_LIST_COLUMNS, PinnedReorderSerializer
 from workspace.files.services import FileService
 
 
@@ -23,8 +24,6 @@ class FavoritesMixin:
     @action(detail=True, methods=["post", "delete"], url_path="favorite")
     def favorite(self, request, uuid=None):
         """Add or remove a file/folder from favorites."""
-        from workspace.files.actions import ActionRegistry
-
         file_obj, perm = self._resolve_file_with_access(uuid)
         if not ActionRegistry.is_action_available(
             "toggle_favorite",
@@ -50,8 +49,6 @@ class FavoritesMixin:
     @action(detail=True, methods=["post", "delete"], url_path="pin")
     def pin(self, request, uuid=None):
         """Pin or unpin a folder from the sidebar."""
-        from workspace.files.actions import ActionRegistry
-
         file_obj = self.get_object()
         # Distinguish "wrong shape" (400) from "not allowed for this user/state"
         # (403). The action also blocks group-root folders, deleted files and
@@ -94,30 +91,21 @@ class FavoritesMixin:
     @action(detail=False, methods=["get"], url_path="pinned")
     def pinned(self, request):
         """List pinned folders."""
-        pinned_qs = (
-            PinnedFolder.objects.filter(
-                owner=request.user,
-                folder__deleted_at__isnull=True,
-            )
-            .select_related("folder")
-            .order_by("position", "created_at")
-        )
-        folder_ids = [p.folder_id for p in pinned_qs]
         # Use the access-aware filter so pinned group subfolders are included.
         # ``self.get_queryset()`` is owner-scoped (group__isnull=True) and would
         # silently drop any pinned group folder.
         queryset = FileService.annotate_for_serializer(
             File.objects.filter(
                 FileService.accessible_files_q(request.user),
-                pk__in=folder_ids,
+                pins__owner=request.user,
                 deleted_at__isnull=True,
-            ),
+            ).only(*FILE_LIST_COLUMNS),
             request.user,
         )
-        # Preserve pin order
-        order_map = {fid: i for i, fid in enumerate(folder_ids)}
-        folders = sorted(queryset, key=lambda f: order_map.get(f.pk, 0))
-        serializer = self.get_serializer(folders, many=True)
+        # Ordering reuses the pins join from the filter above; the
+        # (owner, folder) unique constraint keeps it to one row per folder.
+        queryset = queryset.order_by("pins__position", "pins__created_at")
+        serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
     @extend_schema(
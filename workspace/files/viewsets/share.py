@@ -6,6 +6,7 @@ from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from workspace.files.actions import ActionRegistry
 from workspace.files.models import FileShare, FileShareLink
 from workspace.files.services import FileService
 from workspace.files.services.sharing import (
@@ -53,8 +54,6 @@ class ShareMixin:
     @action(detail=True, methods=["post", "delete"], url_path="share")
     def share(self, request, uuid=None):
         """Share or unshare a file with another user (files only)."""
-        from workspace.files.actions import ActionRegistry
-
         file_obj = self.get_object()
         perm = FileService.get_permission(request.user, file_obj)
 
@@ -3,7 +3,6 @@
 from datetime import timedelta
 
 from django.conf import settings
-from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
@@ -11,11 +10,14 @@ from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from workspace.files.models import File, FileShare
-from workspace.files.serializers import FileSerializer
+from workspace.common.booleans import is_truthy
+from workspace.files.models import File
+from workspace.files.serializers import FILE_LIST_COLUMNS, FileSerializer
 from workspace.files.services import FileService
 
 TRASH_RETENTION_DAYS = getattr(settings, "TRASH_RETENTION_DAYS", 30)
+CLEAN_TRASH_BATCH_SIZE = 500
+TRASH_LIST_CHUNK_SIZE = 500
 
 
 class TrashMixin:
@@ -106,17 +108,16 @@ class TrashMixin:
     @action(detail=False, methods=["get"], url_path="trash")
     def trash(self, request):
         """List trashed files and folders."""
-        queryset = File.objects.filter(owner=request.user, deleted_at__isnull=False)
-        queryset = FileService.annotate_for_serializer(queryset, request.user).annotate(
-            user_share_permission=Subquery(
-                FileShare.objects.filter(
-                    file_id=OuterRef("pk"),
-                    shared_with=request.user,
-                ).values("permission")[:1]
-            ),
-        )
+        queryset = File.objects.filter(
+            owner=request.user, deleted_at__isnull=False
+        ).only(*FILE_LIST_COLUMNS)
+        queryset = FileService.annotate_for_serializer(queryset, request.user)
         queryset = self.filter_queryset(queryset)
-        serializer = self.get_serializer(queryset, many=True)
+        # Stream model instances in chunks instead of caching the whole
+        # trash on the queryset; the tags prefetch runs once per chunk.
+        serializer = self.get_serializer(
+            queryset.iterator(chunk_size=TRASH_LIST_CHUNK_SIZE), many=True
+        )
         return Response(serializer.data)
 
     @extend_schema(
@@ -142,24 +143,29 @@ class TrashMixin:
     @action(detail=False, methods=["delete"], url_path="trash/clean")
     def clean_trash(self, request):
         """Permanently delete trashed items past retention (or force all)."""
-        force_value = self.request.query_params.get("force")
-        force = (
-            str(force_value).lower() in {"1", "true", "yes"}
-            if force_value is not None
-            else False
-        )
+        force = is_truthy(self.request.query_params.get("force"))
         retention_days = TRASH_RETENTION_DAYS
         cutoff = timezone.now() - timedelta(days=retention_days)
         queryset = File.objects.filter(owner=request.user, deleted_at__isnull=False)
         if not force:
             queryset = queryset.filter(deleted_at__lt=cutoff)
-        # Count Files explicitly so the response reflects deleted *files*,
-        # not the cascaded total (which inflates the number with related
-        # rows like FileShare, comments, etc).
-        file_count = queryset.count()
-        # select_related('owner') avoids N+1 in the pre_delete signal,
-        # which reads instance.owner.username for each File.
-        queryset.select_related("owner").delete()
+        # Delete in batches so a huge trash never has every row (and its
+        # cascade) collected in memory at once. Rows removed by an earlier
+        # batch's cascade simply drop out of the next pk slice.
+        pks = queryset.order_by().values_list("pk", flat=True)
+        file_count = 0
+        while True:
+            batch = list(pks[:CLEAN_TRASH_BATCH_SIZE])
+            if not batch:
+                break
+            # select_related('owner') avoids N+1 in the pre_delete signal,
+            # which reads instance.owner.username for each File.
+            _, deleted_per_model = (
+                File.objects.filter(pk__in=batch).select_related("owner").delete()
+            )
+            # Count File rows only, not the cascaded total (which inflates
+            # the number with related rows like FileShare, comments, etc).
+            file_count += deleted_per_model.get(File._meta.label, 0)
         return Response(
             {
                 "deleted": file_count,
@@ -12,6 +12,7 @@ from wsgidav.dc.base_dc import BaseDomainController
 _auth_cache = {}
 _auth_lock = threading.Lock()
 _AUTH_TTL = 60  # seconds
+_AUTH_CACHE_MAX = 1024  # entries
 _CACHE_KEY_SECRET = os.urandom(32)
 
 
@@ -20,7 +21,7 @@ class DjangoBasicDomainController(BaseDomainController):
 
     Results are cached for ``_AUTH_TTL`` seconds to avoid running the
     full authentication backend (bcrypt hash + DB query) on every HTTP
-    request.
+    request.  The cache holds at most ``_AUTH_CACHE_MAX`` entries.
     """
 
     def __init__(self, wsgidav_app, config):
@@ -40,20 +41,39 @@ class DjangoBasicDomainController(BaseDomainController):
 
         with _auth_lock:
             entry = _auth_cache.get(cache_key)
-            if entry and time.monotonic() - entry[1] < _AUTH_TTL:
-                environ["workspace.user"] = entry[0]
-                return True
+            if entry:
+                if time.monotonic() - entry[1] < _AUTH_TTL:
+                    environ["workspace.user"] = entry[0]
+                    return True
+                del _auth_cache[cache_key]
 
         user = authenticate(username=user_name, password=password)
         if user is None or not user.is_active:
             return False
 
         with _auth_lock:
-            _auth_cache[cache_key] = (user, time.monotonic())
+            now = time.monotonic()
+            _prune_auth_cache(now)
+            _auth_cache[cache_key] = (user, now)
         environ["workspace.user"] = user
         return True
 
 
+def _prune_auth_cache(now):
+    """Make room for one entry: drop expired entries, then the oldest.
+
+    Entries are only inserted on a miss (expired ones are deleted first), so
+    dict order is age order and the first key is always the oldest.  Must be
+    called with ``_auth_lock`` held.
+    """
+    while _auth_cache:
+        oldest = next(iter(_auth_cache))
+        expired = now - _auth_cache[oldest][1] >= _AUTH_TTL
+        if not expired and len(_auth_cache) < _AUTH_CACHE_MAX:
+            return
+        del _auth_cache[oldest]
+
+
 def _cache_key(user_name, password):
     """Return a deterministic, non-reversible cache key for the given credentials.
 
@@ -8,7 +8,13 @@ from wsgidav.dav_provider import DAVProvider
 from workspace.files.models import File
 from workspace.files.services import FileService
 
-from .resources import FileResource, FolderResource, RootCollection
+from .resources import (
+    RESOLVE_CACHE_KEY,
+    FileResource,
+    FolderResource,
+    RootCollection,
+    _path_parts,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,21 +34,35 @@ class WorkspaceDAVProvider(DAVProvider):
 
         path = path.rstrip("/") or "/"
 
-        if path == "/":
+        # WsgiDAV resolves the same paths several times per request
+        # (target, parent, lock checks).  Each request gets a fresh environ,
+        # so the memo never outlives it; mutating resource hooks drop it.
+        resolved = environ.setdefault(RESOLVE_CACHE_KEY, {})
+        if path not in resolved:
+            resolved[path] = self._resolve(path, environ, user)
+        return resolved[path]
+
+    def _resolve(self, path, environ, user):
+        parts = _path_parts(path)
+        if not parts:
             return RootCollection("/", environ)
 
-        parts = path.strip("/").split("/")
-
         # File.path stores the tree path without username prefix,
         # e.g. "FolderA/SubFolder/file.txt"
         # Use .filter().first() instead of .get() to survive duplicates
         # that can arise from concurrent PUT requests (race in
         # create_empty_resource).
-        file_obj = File.objects.filter(
-            FileService.accessible_files_q(user),
-            path="/".join(parts),
-            deleted_at__isnull=True,
-        ).first()
+        # Writes need ``owner`` (storage path) and moves need ``parent``;
+        # joining them here saves a query per resolved resource.
+        file_obj = (
+            File.objects.filter(
+                FileService.accessible_files_q(user),
+                path="/".join(parts),
+                deleted_at__isnull=True,
+            )
+            .select_related("parent", "owner")
+            .first()
+        )
 
         if file_obj is None:
             # Fall back to walking the tree segment by segment
@@ -58,34 +78,34 @@ class WorkspaceDAVProvider(DAVProvider):
     def _walk_path(user, parts):
         """Resolve path by name + parent as a single query fallback.
 
-        Tries matching the leaf name with the expected parent path first
-        (1 query).  Falls back to a segment-by-segment walk only when
-        the parent path lookup also misses (e.g. stale ``path`` field).
+        Matches the leaf name under a parent found by its path, in one
+        joined query, for when the leaf's own ``path`` field is stale.
         """
         accessible = FileService.accessible_files_q(user)
 
         if len(parts) == 1:
-            return File.objects.filter(
+            return (
+                File.objects.filter(
+                    accessible,
+                    parent__isnull=True,
+                    name=parts[0],
+                    deleted_at__isnull=True,
+                )
+                .select_related("owner")
+                .first()
+            )
+
+        return (
+            File.objects.filter(
                 accessible,
-                parent__isnull=True,
-                name=parts[0],
+                parent__path="/".join(parts[:-1]),
+                parent__deleted_at__isnull=True,
+                name=parts[-1],
                 deleted_at__isnull=True,
-            ).first()
-
-        parent_path = "/".join(parts[:-1])
-        parent = File.objects.filter(
-            accessible,
-            path=parent_path,
-            deleted_at__isnull=True,
-        ).first()
-        if parent is None:
-            return None
-        return File.objects.filter(
-            accessible,
-            parent=parent,
-            name=parts[-1],
-            deleted_at__isnull=True,
-        ).first()
+            )
+            .select_related("parent", "owner")
+            .first()
+        )
 
     @staticmethod
     def _get_user(environ):
@@ -18,6 +18,28 @@ from workspace.files.services import FileService
 
 logger = logging.getLogger(__name__)
 
+# environ keys of the per-request memos: the provider's path -> resource
+# map, and the destination folders resolved by ``_resolve_parent``.
+RESOLVE_CACHE_KEY = "workspace.dav.resolved"
+FOLDER_CACHE_KEY = "workspace.dav.folders"
+
+# Columns read when a listed member answers PROPFIND (display info, size,
+# type, timestamps, etag).  Anything else - the content pointer included -
+# loads on demand for the rare member that is then read or copied.
+_MEMBER_FIELDS = (
+    "uuid",
+    "name",
+    "node_type",
+    "parent_id",
+    "owner_id",
+    "group_id",
+    "size",
+    "mime_type",
+    "type",
+    "created_at",
+    "updated_at",
+)
+
 
 class _StreamingWriteBuffer:
     """Write buffer that streams data directly to Django storage.
@@ -45,7 +67,10 @@ class _StreamingWriteBuffer:
         self._full_path = full_path
         self._temp_path = f"{full_path}.{uuid.uuid4().hex}.part"
         self._flush_size = flush_size
-        self._membuf = bytearray()
+        # Pending chunks are kept as-is and joined once per flush: growing a
+        # single bytearray re-copies the buffered bytes on every resize.
+        self._chunks = []
+        self._buffered = 0
         self._total_size = 0
         self._fd = None
         self._open()
@@ -59,9 +84,12 @@ class _StreamingWriteBuffer:
         )
 
     def write(self, data):
-        self._membuf.extend(data)
+        # bytes() is free for immutable bytes and snapshots any other
+        # buffer the caller might reuse before the next flush.
+        self._chunks.append(bytes(data))
+        self._buffered += len(data)
         self._total_size += len(data)
-        if len(self._membuf) >= self._flush_size:
+        if self._buffered >= self._flush_size:
             self._flush()
         return len(data)
 
@@ -73,15 +101,16 @@ class _StreamingWriteBuffer:
         pass  # deferred — wsgidav calls close() before end_write()
 
     def _flush(self):
-        if not self._membuf:
+        if not self._chunks:
             return
         # os.write may write fewer bytes than requested (POSIX); loop or
         # the unwritten tail is silently dropped.
-        view = memoryview(self._membuf)
+        view = memoryview(b"".join(self._chunks))
         while view:
             written = os.write(self._fd, view)
             view = view[written:]
-        self._membuf = bytearray()
+        self._chunks = []
+        self._buffered = 0
 
     @property
     def size(self):
@@ -110,7 +139,66 @@ class _StreamingWriteBuffer:
             logger.debug("Could not remove partial upload %s", scrub(self._temp_path))
 
 
-class RootCollection(DAVCollection):
+def _forget_resolved(environ, *, keep_folders=False):
+    """Drop the request's resolved resources after the tree changed.
+
+    ``keep_folders`` is for changes that only add nodes (copies): existing
+    folders keep their path, so memoized destination folders stay valid.
+    """
+    environ.pop(RESOLVE_CACHE_KEY, None)
+    if not keep_folders:
+        environ.pop(FOLDER_CACHE_KEY, None)
+
+
+class _CachedMembersMixin:
+    """Serve the ``get_member*`` hooks from a single query of the children.
+
+    During a Depth:1 PROPFIND WsgiDAV asks for each member by name: without
+    the cache every child costs a query.  The cache is keyed by name, so
+    duplicate rows (left behind by concurrent PUTs) collapse to the first
+    one, as a lookup by name would.  A bare name listing plucks the names
+    instead of building the cache, unless it is already populated.
+    Subclasses provide ``_members_queryset()``; hooks adding children must
+    call ``_invalidate_members()``.
+    """
+
+    _members_cache = None
+
+    def get_member_names(self):
+        if self._members_cache is not None:
+            return list(self._members_cache)
+        names = self._members_queryset().values_list("name", flat=True)
+        return list(dict.fromkeys(names))
+
+    def get_member(self, name):
+        file_obj = self._members().get(name)
+        if file_obj is None:
+            return None
+        return self._wrap(file_obj)
+
+    def get_member_list(self):
+        return [self._wrap(f) for f in self._members().values()]
+
+    def _members(self):
+        if self._members_cache is None:
+            members = {}
+            for file_obj in self._members_queryset().only(*_MEMBER_FIELDS):
+                members.setdefault(file_obj.name, file_obj)
+            self._members_cache = members
+        return self._members_cache
+
+    def _invalidate_members(self):
+        self._members_cache = None
+        _forget_resolved(self.environ)
+
+    def _wrap(self, file_obj):
+        child_path = self.path.rstrip("/") + "/" + file_obj.name
+        if file_obj.is_folder():
+            return FolderResource(child_path, self.environ, file_obj)
+        return FileResource(child_path, self.environ, file_obj)
+
+
+class RootCollection(_CachedMembersMixin, DAVCollection):
     """Virtual root representing the user's top-level files/folders."""
 
     def __init__(self, path, environ):
@@ -136,38 +224,13 @@ class RootCollection(DAVCollection):
         # entry in Explorer.  A static label avoids that.
         return "workspace"
 
-    def get_member_names(self):
-        self._prefetch_members()
-        return [f.name for f in self._members_cache]
-
-    def get_member(self, name):
-        self._prefetch_members()
-        for f in self._members_cache:
-            if f.name == name:
-                return self._wrap(f)
-        return None
-
-    def get_member_list(self):
-        self._prefetch_members()
-        return [self._wrap(f) for f in self._members_cache]
-
-    def _prefetch_members(self):
-        if hasattr(self, "_members_cache"):
-            return
-        self._members_cache = list(
-            File.objects.filter(
-                FileService.accessible_files_q(self._user),
-                parent__isnull=True,
-                deleted_at__isnull=True,
-            )
+    def _members_queryset(self):
+        return File.objects.filter(
+            FileService.accessible_files_q(self._user),
+            parent__isnull=True,
+            deleted_at__isnull=True,
         )
 
-    def _wrap(self, file_obj):
-        child_path = self.path.rstrip("/") + "/" + file_obj.name
-        if file_obj.is_folder():
-            return FolderResource(child_path, self.environ, file_obj)
-        return FileResource(child_path, self.environ, file_obj)
-
     def create_empty_resource(self, name):
         # Reuse an existing file to avoid duplicates from concurrent PUTs
         # (e.g. Windows retries while a slow upload is still in progress).
@@ -185,11 +248,13 @@ class RootCollection(DAVCollection):
                 parent=None,
                 acting_user=self._user,
             )
+            self._invalidate_members()
         child_path = self.path.rstrip("/") + "/" + name
         return FileResource(child_path, self.environ, file_obj)
 
     def create_collection(self, name):
         FileService.create_folder(self._user, name, parent=None, acting_user=self._user)
+        self._invalidate_members()
         return True
 
     def get_used_bytes(self):
@@ -199,7 +264,7 @@ class RootCollection(DAVCollection):
         return max(0, django_settings.STORAGE_QUOTA_BYTES - self.get_used_bytes())
 
 
-class FolderResource(DAVCollection):
+class FolderResource(_CachedMembersMixin, DAVCollection):
     """Wraps a ``File(node_type=FOLDER)`` instance."""
 
     def __init__(self, path, environ, file_obj):
@@ -216,38 +281,13 @@ class FolderResource(DAVCollection):
     def get_last_modified(self):
         return self._file.updated_at.timestamp()
 
-    def get_member_names(self):
-        self._prefetch_members()
-        return [f.name for f in self._members_cache]
-
-    def get_member(self, name):
-        self._prefetch_members()
-        for f in self._members_cache:
-            if f.name == name:
-                return self._wrap(f)
-        return None
-
-    def get_member_list(self):
-        self._prefetch_members()
-        return [self._wrap(f) for f in self._members_cache]
-
-    def _prefetch_members(self):
-        if hasattr(self, "_members_cache"):
-            return
-        self._members_cache = list(
-            File.objects.filter(
-                FileService.accessible_files_q(self._user),
-                parent=self._file,
-                deleted_at__isnull=True,
-            )
+    def _members_queryset(self):
+        return File.objects.filter(
+            FileService.accessible_files_q(self._user),
+            parent=self._file,
+            deleted_at__isnull=True,
         )
 
-    def _wrap(self, file_obj):
-        child_path = self.path.rstrip("/") + "/" + file_obj.name
-        if file_obj.is_folder():
-            return FolderResource(child_path, self.environ, file_obj)
-        return FileResource(child_path, self.environ, file_obj)
-
     def create_empty_resource(self, name):
         # Reuse an existing file to avoid duplicates from concurrent PUTs.
         # Use accessible_files_q so we also find files created by other
@@ -266,6 +306,7 @@ class FolderResource(DAVCollection):
                 parent=self._file,
                 acting_user=self._user,
             )
+            self._invalidate_members()
         child_path = self.path.rstrip("/") + "/" + name
         return FileResource(child_path, self.environ, file_obj)
 
@@ -276,18 +317,21 @@ class FolderResource(DAVCollection):
             parent=self._file,
             acting_user=self._user,
         )
+        self._invalidate_members()
         return True
 
     def delete(self):
+        _forget_resolved(self.environ)
         FileService.soft_delete(self._file, acting_user=self._user)
 
     def copy_move_single(self, dest_path, *, is_move):
+        _forget_resolved(self.environ, keep_folders=True)
         # WsgiDAV's copy/move loop visits every descendant itself, so this
         # hook must only create the destination collection, without members
         # (recursing here would duplicate every child).
-        dest_parts = _dest_parts(dest_path)
+        dest_parts = _path_parts(dest_path)
         new_name = dest_parts[-1]
-        dest_parent = _resolve_parent(self._user, dest_parts[:-1])
+        dest_parent = _resolve_parent(self._user, dest_parts[:-1], environ=self.environ)
         FileService.create_folder(
             self._user,
             new_name,
@@ -300,6 +344,7 @@ class FolderResource(DAVCollection):
 
     @transaction.atomic
     def move_recursive(self, dest_path):
+        _forget_resolved(self.environ)
         _move_to(self._file, self._user, dest_path)
 
     def support_recursive_delete(self):
@@ -354,6 +399,7 @@ class FileResource(DAVNonCollection):
         return self._write_buf
 
     def end_write(self, *, with_errors):
+        _forget_resolved(self.environ)
         buf = self._write_buf
         elapsed = time.monotonic() - getattr(
             self, "_write_started_at", time.monotonic()
@@ -444,17 +490,21 @@ class FileResource(DAVNonCollection):
     def delete(self):
         if getattr(self, "_moved", False):
             return  # Already moved in copy_move_single; nothing to delete.
+        _forget_resolved(self.environ)
         FileService.soft_delete(self._file, acting_user=self._user)
 
     def copy_move_single(self, dest_path, *, is_move):
+        _forget_resolved(self.environ, keep_folders=not is_move)
         if is_move:
             with transaction.atomic():
                 _move_to(self._file, self._user, dest_path)
             self._moved = True
         else:
-            dest_parts = _dest_parts(dest_path)
+            dest_parts = _path_parts(dest_path)
             new_name = dest_parts[-1]
-            dest_parent = _resolve_parent(self._user, dest_parts[:-1])
+            dest_parent = _resolve_parent(
+                self._user, dest_parts[:-1], environ=self.environ
+            )
             _copy_as(self._file, dest_parent, self._user, new_name)
 
     def support_content_length(self):
@@ -470,20 +520,24 @@ class FileResource(DAVNonCollection):
         # WsgiDAV's contract (util.checked_etag): return the bare value
         # without quotes — wsgidav adds them when serializing the HTTP
         # ``ETag:`` header.  Returning a quoted string here triggers a
-        # 500.
-        return f"{self._file.uuid}-{self._file.updated_at.timestamp()}"
-
-
-def _dest_parts(dest_path):
-    """Split a WsgiDAV destination path into non-empty segments.
-
-    WsgiDAV normalizes collection destinations with a trailing slash and
-    builds descendant destinations by concatenation, so paths like
-    ``/dst//child`` reach the resource hooks during folder copies.  Without
-    filtering, parent resolution would chase a ``dst/`` path that doesn't
-    exist and silently re-root the copy.
+        # 500.  Built from row metadata only so PROPFIND never touches
+        # storage; ``updated_at`` is auto_now, so every content write
+        # bumps it.  Same value as the API content endpoint's ETag.
+        file_obj = self._file
+        return f"{file_obj.uuid}-{file_obj.updated_at.timestamp()}"
+
+
+def _path_parts(path):
+    """Split a WsgiDAV path into non-empty segments in a single pass.
+
+    Leading, trailing and doubled slashes all drop out.  WsgiDAV normalizes
+    collection destinations with a trailing slash and builds descendant
+    destinations by concatenation, so paths like ``/dst//child`` reach the
+    resource hooks during folder copies.  Without filtering, parent
+    resolution would chase a ``dst/`` path that doesn't exist and silently
+    re-root the copy.
     """
-    return [part for part in dest_path.split("/") if part]
+    return [part for part in path.split("/") if part]
 
 
 def _move_to(file_obj, user, dest_path):
@@ -497,12 +551,13 @@ def _move_to(file_obj, user, dest_path):
     carrying the current name.  Pick whichever order is collision-free;
     renaming first is the default.
     """
-    dest_parts = _dest_parts(dest_path)
+    dest_parts = _path_parts(dest_path)
     new_name = dest_parts[-1]
     dest_parent = _resolve_parent(user, dest_parts[:-1])
 
     needs_rename = new_name != file_obj.name
-    needs_move = dest_parent != file_obj.parent
+    dest_parent_id = dest_parent.pk if dest_parent is not None else None
+    needs_move = dest_parent_id != file_obj.parent_id
 
     rename_first = not (
         needs_rename
@@ -554,14 +609,25 @@ def _copy_as(file_obj, dest_parent, owner, new_name):
             file_obj.content.close()
 
 
-def _resolve_parent(user, path_parts):
-    """Resolve path segments to a parent folder in a single query."""
+def _resolve_parent(user, path_parts, *, environ=None):
+    """Resolve path segments to a parent folder in a single query.
+
+    With *environ*, found folders are memoized for the rest of the request:
+    a folder COPY resolves the same destination parent for every copied
+    descendant.
+    """
     if not path_parts:
         return None
     target_path = "/".join(path_parts)
-    return File.objects.filter(
-        FileService.accessible_files_q(user),
-        path=target_path,
-        node_type=File.NodeType.FOLDER,
-        deleted_at__isnull=True,
-    ).first()
+    memo = environ.setdefault(FOLDER_CACHE_KEY, {}) if environ is not None else {}
+    folder = memo.get(target_path)
+    if folder is None:
+        folder = File.objects.filter(
+            FileService.accessible_files_q(user),
+            path=target_path,
+            node_type=File.NodeType.FOLDER,
+            deleted_at__isnull=True,
+        ).first()
+        if folder is not None:
+            memo[target_path] = folder
+    return folder